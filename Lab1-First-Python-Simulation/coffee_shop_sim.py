@@ -12,8 +12,11 @@ Learning Objectives:
 - See the relationship between server utilization and customer wait times
 """
 
-import random
-import math
+import multiprocessing as mp
+import sys
+
+import numpy as np
+from numba import njit, prange
 
 # --- Input Parameters ---
 # These parameters define the behavior of our queuing system
@@ -21,106 +24,342 @@ MEAN_INTERARRIVAL_TIME = 3.0  # Average time (in minutes) between customer arriv
 MIN_SERVICE_TIME = 2.0        # Minimum time (in minutes) for the barista to make a drink
 MAX_SERVICE_TIME = 5.0        # Maximum time (in minutes) for the barista to make a drink
 NUM_CUSTOMERS_TO_SIMULATE = 100  # Number of customers to simulate
+NUM_REPLICATIONS = 20            # Independent runs used for confidence intervals
+
+# "What-if" sweep over the mean interarrival time (utilization curve)
+SWEEP_MEAN_INTERARRIVAL_TIMES = np.linspace(3.6, 8.0, 12)
+SWEEP_CUSTOMERS = 10000          # Customers per sweep point (longer runs, smoother curve)
+
+# Optional: Set a seed for reproducibility (use None for true randomness)
+SEED = None
+
+# --- Queue Kernel ---
+# The queue recurrence is inherently sequential (each customer depends on when the
+# previous one finished), so it cannot be a single NumPy operation. Numba compiles
+# this small loop to native code instead.
+#
+# cache=True: the first run writes the compiled kernel to __pycache__/, so later
+# runs load it from disk instead of recompiling (the kernel must stay a module-level
+# function for caching to work).
+@njit(cache=True, fastmath=True, boundscheck=False)
+def simulate_queue(arrival_times, service_times):
+    """
+    Run the single-server FIFO queue over pre-sampled arrivals and service times.
+
+    Args:
+        arrival_times: Array of customer arrival times (minutes)
+        service_times: Array of customer service times (minutes)
+
+    Returns:
+        tuple: (wait_times, times_in_system, server_idle_periods) arrays
+    """
+    n = arrival_times.shape[0]
+
+    # These preallocated arrays will store the results for each customer for later analysis
+    wait_times = np.empty(n, dtype=np.float64)
+    times_in_system = np.empty(n, dtype=np.float64)
+    server_idle_periods = np.empty(n, dtype=np.float64)
+
+    # This variable tracks the state of the system from one customer to the next
+    time_server_is_free = 0.0  # This is the same as the "Time Service Ends" of the previous customer
+
+    for i in range(n):
+        arrival_time = arrival_times[i]
+
+        # Service begins at the later of two times:
+        #   - When the customer arrives, OR
+        #   - When the server becomes free
+        # If the server is busy when the customer arrives, they must wait!
+        if arrival_time > time_server_is_free:
+            time_service_begins = arrival_time
+        else:
+            time_service_begins = time_server_is_free
+
+        time_service_ends = time_service_begins + service_times[i]
+        wait_times[i] = time_service_begins - arrival_time  # How long they waited
+        times_in_system[i] = time_service_ends - arrival_time  # Total time (wait + service)
+        server_idle_periods[i] = time_service_begins - time_server_is_free  # Server idle before this customer
+
+        # Update the state variable for the *next* customer's arrival
+        time_server_is_free = time_service_ends
+
+    return wait_times, times_in_system, server_idle_periods
+
+
+# --- Parameter Sweep Kernel ---
+# Each sweep point is an independent queue, so Numba runs them on parallel threads.
+# All points reuse the same unit-mean exponential and service draws (common random
+# numbers), which keeps the curve smooth and needs just one RNG draw for the sweep.
+@njit(parallel=True, cache=True)
+def sweep_queue(mean_interarrival_times, unit_interarrival_times, service_times):
+    """
+    Run the queue once per mean interarrival time and return summary KPIs.
+
+    Args:
+        mean_interarrival_times: Array of mean interarrival times to evaluate (minutes)
+        unit_interarrival_times: Exponential draws with mean 1, scaled per sweep point
+        service_times: Array of customer service times (minutes)
 
-# Optional: Set a seed for reproducibility (comment out for true randomness)
-# random.seed(42)
+    Returns:
+        tuple: (avg_wait_times, server_utilizations) arrays, one entry per sweep point
+    """
+    num_points = mean_interarrival_times.shape[0]
+    n = unit_interarrival_times.shape[0]
+    avg_wait_times = np.empty(num_points, dtype=np.float64)
+    server_utilizations = np.empty(num_points, dtype=np.float64)
 
-# --- State Variables and Result Lists ---
-# These variables track the state of the system from one customer to the next
-time_of_previous_arrival = 0.0
-time_server_is_free = 0.0  # This is the same as the "Time Service Ends" of the previous customer
+    for k in prange(num_points):
+        mean_interarrival_time = mean_interarrival_times[k]
+        arrival_time = 0.0
+        time_server_is_free = 0.0
+        total_wait = 0.0
+        total_idle = 0.0
 
-# These lists will store the results for each customer for later analysis
-wait_times = []
-times_in_system = []
-server_idle_periods = []
-arrival_times = []
-service_times = []
+        for i in range(n):
+            arrival_time += unit_interarrival_times[i] * mean_interarrival_time
+            if arrival_time > time_server_is_free:
+                time_service_begins = arrival_time
+            else:
+                time_service_begins = time_server_is_free
+            total_wait += time_service_begins - arrival_time
+            total_idle += time_service_begins - time_server_is_free
+            time_server_is_free = time_service_begins + service_times[i]
 
-# --- Main Simulation Loop ---
-print(f"--- Simulating {NUM_CUSTOMERS_TO_SIMULATE} Customers ---")
+        avg_wait_times[k] = total_wait / n
+        server_utilizations[k] = (time_server_is_free - total_idle) / time_server_is_free
 
-for customer_num in range(1, NUM_CUSTOMERS_TO_SIMULATE + 1):
-    # 1. Calculate Inter-Arrival Time and this customer's Arrival Time
-    # Using exponential distribution: -ln(U) * mean
+    return avg_wait_times, server_utilizations
+
+
+# --- Simulation Run ---
+def simulate_customers(rng):
+    """
+    Sample random inputs for every customer and run them through the queue.
+
+    Args:
+        rng: NumPy random Generator used for all random draws
+
+    Returns:
+        tuple: (arrival_times, service_times, wait_times, times_in_system, server_idle_periods)
+    """
+    # Every customer's random numbers are independent of the queue state, so we can
+    # draw all of them in one vectorized call instead of one call per customer.
+
+    # 1. Inter-Arrival Times using exponential distribution (equivalent to -ln(U) * mean)
     # This models random arrivals (Poisson process)
-    interarrival_time = -math.log(random.random()) * MEAN_INTERARRIVAL_TIME
-    arrival_time = time_of_previous_arrival + interarrival_time
-
-    # 2. Calculate Service Time for this customer
-    # Using uniform distribution between min and max
-    service_time = random.uniform(MIN_SERVICE_TIME, MAX_SERVICE_TIME)
-
-    # 3. Calculate when service begins for this customer
-    # This is the core logic of the queue!
-    # Service begins at the later of two times:
-    #   - When the customer arrives, OR
-    #   - When the server becomes free
-    # If the server is busy when the customer arrives, they must wait!
-    time_service_begins = max(arrival_time, time_server_is_free)
-
-    # 4. Calculate key metrics for this customer
-    wait_in_queue = time_service_begins - arrival_time  # How long they waited
-    time_service_ends = time_service_begins + service_time  # When service completes
-    time_in_system = time_service_ends - arrival_time  # Total time (wait + service)
-    server_idle_time = time_service_begins - time_server_is_free  # How long server was idle before this customer
-
-    # 5. Store the results in our lists
-    wait_times.append(wait_in_queue)
-    times_in_system.append(time_in_system)
-    server_idle_periods.append(server_idle_time)
-    arrival_times.append(arrival_time)
-    service_times.append(service_time)
-
-    # 6. Update the state variables for the *next* customer's arrival
-    time_of_previous_arrival = arrival_time
-    time_server_is_free = time_service_ends
-
-# --- Calculate and Display Output KPIs ---
-
-# Calculate Average Wait Time
-avg_wait_time = sum(wait_times) / len(wait_times)
-
-# Calculate Probability of Waiting
-customers_who_waited = len([w for w in wait_times if w > 0])
-prob_wait = customers_who_waited / NUM_CUSTOMERS_TO_SIMULATE
-
-# Calculate Server Utilization
-total_simulation_time = time_server_is_free  # Time the last customer leaves
-total_idle_time = sum(server_idle_periods)
-total_busy_time = total_simulation_time - total_idle_time
-server_utilization = total_busy_time / total_simulation_time
-
-# Calculate other metrics
-avg_time_in_system = sum(times_in_system) / len(times_in_system)
-max_wait_time = max(wait_times)
-avg_service_time = sum(service_times) / len(service_times)
-
-# Print the results in a clean format
-print("\n" + "="*50)
-print("           SIMULATION RESULTS")
-print("="*50)
-print(f"\nInput Parameters:")
-print(f"  Mean Interarrival Time: {MEAN_INTERARRIVAL_TIME:.2f} minutes")
-print(f"  Service Time Range:     {MIN_SERVICE_TIME:.2f} - {MAX_SERVICE_TIME:.2f} minutes")
-print(f"  Number of Customers:    {NUM_CUSTOMERS_TO_SIMULATE}")
-print(f"\nPerformance Metrics:")
-print(f"  Average Wait Time:      {avg_wait_time:.2f} minutes")
-print(f"  Maximum Wait Time:      {max_wait_time:.2f} minutes")
-print(f"  Probability of Waiting: {prob_wait:.2%}")
-print(f"  Server Utilization:     {server_utilization:.2%}")
-print(f"  Average Time in System: {avg_time_in_system:.2f} minutes")
-print(f"  Average Service Time:   {avg_service_time:.2f} minutes")
-print(f"\nSimulation Statistics:")
-print(f"  Total Simulation Time:  {total_simulation_time:.2f} minutes")
-print(f"  Total Server Busy Time: {total_busy_time:.2f} minutes")
-print(f"  Total Server Idle Time: {total_idle_time:.2f} minutes")
-print("="*50)
-
-# --- Optional: Show first few customers in detail ---
-print("\nFirst 10 Customers (detailed):")
-print(f"{'Cust':<6}{'Arrival':<10}{'Wait':<10}{'Service':<10}{'In System':<12}")
-print("-" * 50)
-for i in range(min(10, NUM_CUSTOMERS_TO_SIMULATE)):
-    print(f"{i+1:<6}{arrival_times[i]:<10.2f}{wait_times[i]:<10.2f}"
-          f"{service_times[i]:<10.2f}{times_in_system[i]:<12.2f}")
+    interarrival_times = rng.exponential(MEAN_INTERARRIVAL_TIME, NUM_CUSTOMERS_TO_SIMULATE)
+    arrival_times = np.cumsum(interarrival_times)  # Each arrival = previous arrival + gap
+
+    # 2. Service Times using uniform distribution between min and max
+    service_times = rng.uniform(MIN_SERVICE_TIME, MAX_SERVICE_TIME, NUM_CUSTOMERS_TO_SIMULATE)
+
+    # 3. Push every customer through the queue
+    wait_times, times_in_system, server_idle_periods = simulate_queue(arrival_times, service_times)
+
+    return arrival_times, service_times, wait_times, times_in_system, server_idle_periods
+
+
+def calculate_kpis(arrival_times, service_times, wait_times, times_in_system, server_idle_periods):
+    """
+    Calculate output KPIs from per-customer result arrays.
+
+    Returns:
+        dict: KPI name -> value
+    """
+    # Each KPI is a single vectorized reduction over a contiguous array
+    num_customers = wait_times.shape[0]
+
+    # Calculate Server Utilization
+    total_simulation_time = arrival_times[-1] + times_in_system[-1]  # Time the last customer leaves
+    total_idle_time = server_idle_periods.sum()
+    total_busy_time = total_simulation_time - total_idle_time
+
+    return {
+        "avg_wait_time": wait_times.mean(),
+        "max_wait_time": wait_times.max(),
+        "prob_wait": np.count_nonzero(wait_times) / num_customers,
+        "server_utilization": total_busy_time / total_simulation_time,
+        "avg_time_in_system": times_in_system.mean(),
+        "avg_service_time": service_times.mean(),
+        "total_simulation_time": total_simulation_time,
+        "total_busy_time": total_busy_time,
+        "total_idle_time": total_idle_time,
+    }
+
+
+def run_once(seed=None):
+    """
+    Run one independent replication of the coffee shop.
+
+    Args:
+        seed: Seed for this replication's random number generator
+
+    Returns:
+        dict: KPIs from this replication
+    """
+    rng = np.random.default_rng(seed)
+    return calculate_kpis(*simulate_customers(rng))
+
+
+def run_replications(num_replications, base_seed=None):
+    """
+    Run independent replications in parallel across CPU cores.
+
+    Replications share nothing, so each worker process simply builds its own
+    random number generator from its seed.
+
+    Args:
+        num_replications: Number of replications to run
+        base_seed: Seed of the first replication (replication i uses base_seed + i);
+            None draws fresh OS entropy for every replication
+
+    Returns:
+        dict: KPI name -> (mean, standard error) across replications
+    """
+    if base_seed is None:
+        seeds = [None] * num_replications
+    else:
+        seeds = range(base_seed, base_seed + num_replications)
+    with mp.Pool() as pool:
+        results = pool.map(run_once, seeds)
+
+    kpi_names = list(results[0])
+    values = np.array([[r[name] for name in kpi_names] for r in results], dtype=np.float64)
+    means = values.mean(axis=0)
+    std_errors = values.std(axis=0, ddof=1) / np.sqrt(num_replications)
+
+    return {name: (means[i], std_errors[i]) for i, name in enumerate(kpi_names)}
+
+
+def run_sweep(mean_interarrival_times, num_customers, seed=None):
+    """
+    Evaluate the coffee shop over a range of mean interarrival times.
+
+    Args:
+        mean_interarrival_times: Mean interarrival times to evaluate (minutes)
+        num_customers: Customers simulated at each sweep point
+        seed: Seed for the random number generator
+
+    Returns:
+        tuple: (avg_wait_times, server_utilizations) arrays
+    """
+    rng = np.random.default_rng(seed)
+    unit_interarrival_times = rng.exponential(1.0, num_customers)
+    service_times = rng.uniform(MIN_SERVICE_TIME, MAX_SERVICE_TIME, num_customers)
+    return sweep_queue(np.asarray(mean_interarrival_times, dtype=np.float64),
+                       unit_interarrival_times, service_times)
+
+
+def theoretical_wait_time(mean_interarrival_time=MEAN_INTERARRIVAL_TIME):
+    """
+    Expected wait in queue from the Pollaczek-Khinchine formula (M/G/1 queue).
+
+    Exponential arrivals with uniform service times form an M/G/1 queue, so the
+    long-run average wait has a closed form - a zero-variance reference for the
+    simulated value.
+
+    Args:
+        mean_interarrival_time: Mean time between arrivals (minutes)
+
+    Returns:
+        tuple: (utilization rho, expected wait Wq in minutes; inf if rho >= 1)
+    """
+    mean_service = (MIN_SERVICE_TIME + MAX_SERVICE_TIME) / 2
+    var_service = (MAX_SERVICE_TIME - MIN_SERVICE_TIME) ** 2 / 12
+    rho = mean_service / mean_interarrival_time
+    if rho >= 1:
+        return rho, float("inf")  # Unstable: the queue grows without bound
+
+    lq = rho ** 2 * (1 + var_service / mean_service ** 2) / (2 * (1 - rho))
+    wq = lq * mean_interarrival_time  # Little's Law: Wq = Lq / lambda
+    return rho, wq
+
+
+def print_results(kpis):
+    """Print the results of a single run in a clean format."""
+    print("\n" + "="*50)
+    print("           SIMULATION RESULTS")
+    print("="*50)
+    print(f"\nInput Parameters:")
+    print(f"  Mean Interarrival Time: {MEAN_INTERARRIVAL_TIME:.2f} minutes")
+    print(f"  Service Time Range:     {MIN_SERVICE_TIME:.2f} - {MAX_SERVICE_TIME:.2f} minutes")
+    print(f"  Number of Customers:    {NUM_CUSTOMERS_TO_SIMULATE}")
+    print(f"\nPerformance Metrics:")
+    print(f"  Average Wait Time:      {kpis['avg_wait_time']:.2f} minutes")
+    print(f"  Theoretical Wait Time:  {theoretical_wait_time()[1]:.2f} minutes (M/G/1 steady state)")
+    print(f"  Maximum Wait Time:      {kpis['max_wait_time']:.2f} minutes")
+    print(f"  Probability of Waiting: {kpis['prob_wait']:.2%}")
+    print(f"  Server Utilization:     {kpis['server_utilization']:.2%}")
+    print(f"  Average Time in System: {kpis['avg_time_in_system']:.2f} minutes")
+    print(f"  Average Service Time:   {kpis['avg_service_time']:.2f} minutes")
+    print(f"\nSimulation Statistics:")
+    print(f"  Total Simulation Time:  {kpis['total_simulation_time']:.2f} minutes")
+    print(f"  Total Server Busy Time: {kpis['total_busy_time']:.2f} minutes")
+    print(f"  Total Server Idle Time: {kpis['total_idle_time']:.2f} minutes")
+    print("="*50)
+
+
+def print_replication_summary(summary, num_replications):
+    """Print mean and standard error of each KPI across replications."""
+    print(f"\nReplication Summary ({num_replications} replications, mean ± std. error):")
+    print(f"  Average Wait Time:      {summary['avg_wait_time'][0]:.2f} ± {summary['avg_wait_time'][1]:.2f} minutes")
+    print(f"  Maximum Wait Time:      {summary['max_wait_time'][0]:.2f} ± {summary['max_wait_time'][1]:.2f} minutes")
+    print(f"  Probability of Waiting: {summary['prob_wait'][0]:.2%} ± {summary['prob_wait'][1]:.2%}")
+    print(f"  Server Utilization:     {summary['server_utilization'][0]:.2%} ± {summary['server_utilization'][1]:.2%}")
+    print(f"  Average Time in System: {summary['avg_time_in_system'][0]:.2f} ± {summary['avg_time_in_system'][1]:.2f} minutes")
+    print("="*50)
+
+
+def main():
+    # --- Stability Check ---
+    # Warn before simulating if arrivals outpace service on average
+    rho, _ = theoretical_wait_time()
+    if rho >= 1:
+        print(f"WARNING: Offered load rho = {rho:.2f} >= 1 - the system is unstable and "
+              f"the queue grows without bound as more customers are simulated.\n")
+
+    # --- Main Simulation Run ---
+    print(f"--- Simulating {NUM_CUSTOMERS_TO_SIMULATE} Customers ---")
+
+    rng = np.random.default_rng(SEED)
+    arrival_times, service_times, wait_times, times_in_system, server_idle_periods = simulate_customers(rng)
+
+    # --- Calculate and Display Output KPIs ---
+    kpis = calculate_kpis(arrival_times, service_times, wait_times, times_in_system, server_idle_periods)
+    print_results(kpis)
+
+    # --- Optional: Show first few customers in detail ---
+    # np.savetxt formats all rows in C, so this stays cheap even for many rows
+    num_shown = min(10, NUM_CUSTOMERS_TO_SIMULATE)
+    details = np.column_stack([
+        np.arange(1, num_shown + 1),
+        arrival_times[:num_shown],
+        wait_times[:num_shown],
+        service_times[:num_shown],
+        times_in_system[:num_shown],
+    ])
+    print("\nFirst 10 Customers (detailed):", flush=True)
+    np.savetxt(
+        sys.stdout, details,
+        fmt=["%-6d", "%-10.2f", "%-10.2f", "%-10.2f", "%-12.2f"], delimiter="",
+        header=f"{'Cust':<6}{'Arrival':<10}{'Wait':<10}{'Service':<10}{'In System':<12}\n" + "-" * 50,
+        comments="",
+    )
+
+    # --- Multiple Replications ---
+    # A single run is noisy; independent replications give confidence in the KPIs
+    summary = run_replications(NUM_REPLICATIONS, base_seed=SEED)
+    print_replication_summary(summary, NUM_REPLICATIONS)
+
+    # --- What-If Sweep: Utilization Curve ---
+    avg_wait_times, server_utilizations = run_sweep(SWEEP_MEAN_INTERARRIVAL_TIMES, SWEEP_CUSTOMERS, SEED)
+    print(f"\nUtilization Curve ({SWEEP_CUSTOMERS} customers per point):")
+    print(f"{'Mean Interarrival':<20}{'Utilization':<14}{'Avg Wait':<10}")
+    print("-" * 50)
+    for mean_time, utilization, avg_wait in zip(SWEEP_MEAN_INTERARRIVAL_TIMES, server_utilizations, avg_wait_times):
+        print(f"{mean_time:<20.2f}{utilization:<14.2%}{avg_wait:<10.2f}")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()
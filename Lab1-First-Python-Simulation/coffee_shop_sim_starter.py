@@ -6,7 +6,7 @@ Complete the TODOs below to build your first discrete-event simulation!
 """
 
 import random
-import math
+from array import array
 
 # --- Input Parameters ---
 # TODO: Define your simulation parameters here
@@ -20,10 +20,12 @@ NUM_CUSTOMERS_TO_SIMULATE = 100
 time_of_previous_arrival = 0.0
 time_server_is_free = 0.0
 
-# TODO: Create empty lists to store results for each customer
-wait_times = []
-times_in_system = []
-server_idle_periods = []
+# TODO: Create empty arrays to store results for each customer
+# array('d') works like a list (.append, indexing, sum, max) but stores packed
+# C doubles - about 8 bytes per value instead of a full Python float object
+wait_times = array('d')
+times_in_system = array('d')
+server_idle_periods = array('d')
 
 # --- Main Simulation Loop ---
 print(f"--- Simulating {NUM_CUSTOMERS_TO_SIMULATE} Customers ---")
@@ -31,7 +33,8 @@ print(f"--- Simulating {NUM_CUSTOMERS_TO_SIMULATE} Customers ---")
 for customer_num in range(1, NUM_CUSTOMERS_TO_SIMULATE + 1):
 
     # TODO 1: Calculate Inter-Arrival Time using exponential distribution
-    # Formula: -math.log(random.random()) * MEAN_INTERARRIVAL_TIME
+    # Formula: random.expovariate(1.0 / MEAN_INTERARRIVAL_TIME)
+    # (same distribution as -math.log(random.random()) * MEAN_INTERARRIVAL_TIME)
     interarrival_time = # YOUR CODE HERE
 
     # TODO 2: Calculate this customer's arrival time
@@ -63,7 +66,7 @@ for customer_num in range(1, NUM_CUSTOMERS_TO_SIMULATE + 1):
     # Formula: time_service_begins - time_server_is_free
     server_idle_time = # YOUR CODE HERE
 
-    # TODO 9: Store the results in the appropriate lists
+    # TODO 9: Store the results in the appropriate arrays
     # Use .append() method
     # YOUR CODE HERE (3 lines)
 
@@ -13,6 +13,7 @@ alternative strategies before committing to real-world actions.
 
 Prerequisites:
     - simpy (discrete event simulation)
+    - numpy (random number generation)
 
 Usage:
     python predictive_scenario_analysis.py
@@ -25,8 +26,8 @@ What to observe:
 """
 
 import simpy
-import random
-import copy
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 
@@ -58,6 +59,54 @@ SCENARIO_PROPOSED = {
 REALTIME_FACTOR = 0.5  # 1 sim minute = 0.5 real seconds (2x speed)
 DECISION_POINT = 10.0  # Real seconds before triggering analysis
 
+# Random seed for reproducibility. All clones share this seed, so every scenario
+# sees identical processing, failure, and repair times (common random numbers).
+RANDOM_SEED = 42
+
+# Random variates pre-sampled per batch (covers an 8-hour clone without refilling)
+SAMPLE_POOL_SIZE = 2000
+
+
+# ========================================================================================
+# RANDOM VARIATE POOLS
+# ========================================================================================
+
+class SamplePool:
+    """
+    Pre-sampled random variates consumed one at a time.
+
+    Values are drawn in vectorized batches from a dedicated generator and
+    refilled when exhausted. Because each random stream (process, failure,
+    repair) has its own pool, the n-th draw of a stream depends only on the
+    seed - not on how the streams interleave - which keeps common random
+    numbers synchronized across scenarios.
+    """
+
+    def __init__(self, rng, sampler, size=SAMPLE_POOL_SIZE):
+        """
+        Args:
+            rng: NumPy random Generator dedicated to this stream
+            sampler: Function (rng, size) -> array of variates
+            size: Number of variates drawn per batch
+        """
+        self.rng = rng
+        self.sampler = sampler
+        self.size = size
+        self._refill()
+
+    def _refill(self):
+        """Draw the next batch (as Python floats for fast indexing)."""
+        self.values = self.sampler(self.rng, self.size).tolist()
+        self.index = 0
+
+    def next(self):
+        """Return the next pre-sampled value."""
+        if self.index == self.size:
+            self._refill()
+        value = self.values[self.index]
+        self.index += 1
+        return value
+
 
 # ========================================================================================
 # FACTORY SIMULATION MODEL
@@ -74,7 +123,7 @@ class Factory:
     - State management: Save/load capability for forking
     """
 
-    def __init__(self, env, shift_schedule, verbose=True):
+    def __init__(self, env, shift_schedule, verbose=True, rng=None):
         """
         Initialize factory model.
 
@@ -82,17 +131,33 @@ class Factory:
             env: SimPy environment (real-time or standard)
             shift_schedule: Dict of {time: technician_count}
             verbose: Print detailed logs
+            rng: NumPy random Generator (PCG64) owned by this factory; a fresh
+                 unseeded one is created if omitted
         """
         self.env = env
         self.shift_schedule = shift_schedule
         self.verbose = verbose
 
+        # Pre-sampled variates: one pool (and child generator) per random stream
+        self.rng = rng if rng is not None else np.random.default_rng()
+        process_rng, failure_rng, repair_rng = (
+            np.random.default_rng(seed) for seed in self.rng.integers(2**63, size=3)
+        )
+        self._process_time_pool = SamplePool(
+            process_rng, lambda g, n: g.uniform(*MACHINE_PROCESS_TIME, size=n))
+        self._mtbf_pool = SamplePool(
+            failure_rng, lambda g, n: g.exponential(MACHINE_MTBF, size=n))
+        self._repair_time_pool = SamplePool(
+            repair_rng, lambda g, n: g.uniform(*MACHINE_REPAIR_TIME, size=n))
+
         # Resources
         self.machine_queue = simpy.Store(env)
 
-        # Initialize technician resource with capacity from schedule
+        # Technicians are a pool of tokens: a repair takes one and gives it back.
+        # Putting tokens in at a shift change immediately wakes a waiting repair.
         initial_tech_count = shift_schedule[0]
-        self.technicians = simpy.Resource(env, capacity=initial_tech_count)
+        self.technician_count = initial_tech_count
+        self.technicians = simpy.Container(env, init=initial_tech_count)
 
         # Machine state
         self.machine_state = "idle"  # "idle", "processing", "broken"
@@ -111,18 +176,23 @@ class Factory:
 
     def _sample_mtbf(self):
         """Sample time until next failure from exponential distribution."""
-        return random.expovariate(1.0 / MACHINE_MTBF)
+        return self._mtbf_pool.next()
 
     def _sample_process_time(self):
         """Sample part processing time."""
-        return random.uniform(*MACHINE_PROCESS_TIME)
+        return self._process_time_pool.next()
 
     def _sample_repair_time(self):
         """Sample machine repair time."""
-        return random.uniform(*MACHINE_REPAIR_TIME)
+        return self._repair_time_pool.next()
 
     def _log(self, message):
-        """Print log message if verbose mode is enabled."""
+        """
+        Print log message if verbose mode is enabled.
+
+        Hot-path callers also check self.verbose first, so FTRT clones
+        (verbose=False) never pay for building the f-string message.
+        """
         if self.verbose:
             print(f"[t={self.env.now:6.1f}] {message}")
 
@@ -136,18 +206,23 @@ class Factory:
 
         Parts enter the queue and wait for machine processing.
         """
+        # Bind hot attributes to locals once (read on every loop iteration)
+        timeout = self.env.timeout
+        put = self.machine_queue.put
+
         while True:
             # Create new part
             self.parts_created += 1
             part_id = self.parts_created
 
-            self._log(f"Part {part_id} arrived")
+            if self.verbose:
+                self._log(f"Part {part_id} arrived")
 
             # Put part in queue
-            yield self.machine_queue.put(part_id)
+            yield put(part_id)
 
             # Wait for next arrival
-            yield self.env.timeout(PART_ARRIVAL_INTERVAL)
+            yield timeout(PART_ARRIVAL_INTERVAL)
 
     def machine_process(self):
         """
@@ -158,54 +233,58 @@ class Factory:
         - Machine health tracking
         - Failure triggering
         """
+        # Bind hot attributes to locals once (read on every loop iteration)
+        timeout = self.env.timeout
+        get = self.machine_queue.get
+
         while True:
             # Wait for a part to arrive
-            part_id = yield self.machine_queue.get()
+            part_id = yield get()
 
             # Start processing
             self.machine_state = "processing"
             process_time = self._sample_process_time()
             self.current_part_remaining_time = process_time
 
-            self._log(f"Machine started processing Part {part_id} (duration: {process_time:.1f} min)")
+            if self.verbose:
+                self._log(f"Machine started processing Part {part_id} (duration: {process_time:.1f} min)")
 
-            # Process in small chunks to check for failures
-            while self.current_part_remaining_time > 0:
-                # Determine next event: part completion or failure
-                time_to_complete = self.current_part_remaining_time
+            # Failures that strike before the part completes: each one costs a
+            # single timeout to the failure instant plus the repair itself
+            while self.time_to_next_failure < self.current_part_remaining_time:
                 time_to_failure = self.time_to_next_failure
+                yield timeout(time_to_failure)
 
-                if time_to_failure < time_to_complete:
-                    # Machine will fail before part completes!
-                    yield self.env.timeout(time_to_failure)
-
-                    # Update remaining time
-                    self.current_part_remaining_time -= time_to_failure
-                    self.time_to_next_failure = 0
+                # Update remaining time
+                self.current_part_remaining_time -= time_to_failure
+                self.time_to_next_failure = 0
 
-                    # Machine breaks
+                # Machine breaks
+                if self.verbose:
                     self._log(f"⚠ Machine FAILED during Part {part_id} processing!")
                     self._log(f"   Remaining work on part: {self.current_part_remaining_time:.1f} min")
 
-                    # Trigger repair
-                    yield self.env.process(self.repair_machine())
+                # Repair inline (no separate SimPy process needed for a sequential step)
+                yield from self.repair_machine()
 
-                    # After repair, continue processing same part
+                # After repair, continue processing same part
+                if self.verbose:
                     self._log(f"Machine resuming Part {part_id} processing")
 
-                else:
-                    # Part completes before failure
-                    yield self.env.timeout(time_to_complete)
+            # No failure before completion: one timeout finishes the part
+            time_to_complete = self.current_part_remaining_time
+            yield timeout(time_to_complete)
 
-                    # Update machine health
-                    self.time_to_next_failure -= time_to_complete
-                    self.current_part_remaining_time = 0
+            # Update machine health
+            self.time_to_next_failure -= time_to_complete
+            self.current_part_remaining_time = 0
 
             # Part completed
             self.parts_produced += 1
             self.machine_state = "idle"
 
-            self._log(f"Part {part_id} completed (Total: {self.parts_produced})")
+            if self.verbose:
+                self._log(f"Part {part_id} completed (Total: {self.parts_produced})")
 
     def repair_machine(self):
         """
@@ -214,42 +293,47 @@ class Factory:
         This demonstrates resource contention - multiple machines (if we had them)
         would compete for limited technicians.
         """
+        env = self.env
+
         # Machine is now broken
         self.machine_state = "broken"
-        self.downtime_start = self.env.now
+        downtime_start = self.downtime_start = env.now
 
         # Request technician from resource pool
-        self._log(f"Requesting technician for repair...")
+        if self.verbose:
+            self._log(f"Requesting technician for repair...")
 
-        with self.technicians.request() as req:
-            # Wait for technician to become available
-            yield req
+        # Wait for technician to become available
+        yield self.technicians.get(1)
 
-            # Technician arrived
-            repair_time = self._sample_repair_time()
-            self.current_repair_remaining_time = repair_time
+        # Technician arrived
+        repair_time = self._sample_repair_time()
+        self.current_repair_remaining_time = repair_time
 
+        if self.verbose:
             self._log(f"✓ Technician assigned. Repair duration: {repair_time:.1f} min")
 
-            # Perform repair
-            yield self.env.timeout(repair_time)
+        # Perform repair
+        yield env.timeout(repair_time)
 
-            # Repair complete
-            self.current_repair_remaining_time = 0
-            downtime_duration = self.env.now - self.downtime_start
-            self.total_downtime += downtime_duration
+        # Repair complete: technician returns to the pool
+        self.technicians.put(1)
+        self.current_repair_remaining_time = 0
+        downtime_duration = env.now - downtime_start
+        self.total_downtime += downtime_duration
 
-            # Machine is functional again
-            self.time_to_next_failure = self._sample_mtbf()
-            self.machine_state = "idle"
+        # Machine is functional again
+        self.time_to_next_failure = self._sample_mtbf()
+        self.machine_state = "idle"
 
+        if self.verbose:
             self._log(f"✓ Repair completed. Downtime: {downtime_duration:.1f} min")
 
     def shift_manager(self):
         """
         Manage technician availability based on shift schedule.
 
-        This process changes the resource capacity at specified times,
+        This process changes the technician headcount at specified times,
         implementing different scenarios (e.g., adding technicians during busy periods).
         """
         # Sort schedule by time
@@ -262,12 +346,18 @@ class Factory:
             # Wait until schedule change time
             yield self.env.timeout(time - self.env.now)
 
-            # Change technician capacity
-            new_capacity = self.shift_schedule[time]
-            old_capacity = self.technicians.capacity
-            self.technicians._capacity = new_capacity  # Update capacity
+            # Change technician headcount
+            new_count = self.shift_schedule[time]
+            old_count = self.technician_count
+            if new_count > old_count:
+                # Arriving technicians are available at once (wakes a waiting repair)
+                self.technicians.put(new_count - old_count)
+            elif new_count < old_count:
+                # Departing technicians leave as soon as they are free (finish current repair first)
+                self.technicians.get(old_count - new_count)
+            self.technician_count = new_count
 
-            self._log(f"📋 Shift change: Technicians {old_capacity} → {new_capacity}")
+            self._log(f"📋 Shift change: Technicians {old_count} → {new_count}")
 
     # ================================================================================
     # STATE MANAGEMENT (FOR FORKING)
@@ -278,10 +368,13 @@ class Factory:
         Save high-level simulation state for forking.
 
         This captures the essential state needed to resume simulation
-        from this point with different scenarios.
+        from this point with different scenarios. Forking is "state dict +
+        re-instantiate": clones build a fresh environment and Factory from
+        this snapshot, so the live SimPy environment (event heap, process
+        generators) is never deep-copied.
 
         Returns:
-            dict: State snapshot
+            dict: State snapshot of plain numbers/strings (cheap to copy or pickle)
         """
         state = {
             "simulation_time": self.env.now,
@@ -290,7 +383,7 @@ class Factory:
             "time_to_next_failure": self.time_to_next_failure,
             "current_part_remaining_time": self.current_part_remaining_time,
             "current_repair_remaining_time": self.current_repair_remaining_time,
-            "technicians_available": self.technicians.capacity,
+            "technicians_available": self.technician_count,
             "parts_created": self.parts_created,
             "parts_produced": self.parts_produced,
             "total_downtime": self.total_downtime,
@@ -342,30 +435,29 @@ class Factory:
 # PREDICTIVE CLONE RUNNER
 # ========================================================================================
 
-def run_predictive_clone(initial_state, scenario_schedule, duration=480):
+def run_predictive_clone(initial_state, scenario_schedule, duration=480, seed=None):
     """
     Run a faster-than-real-time (FTRT) clone simulation from saved state.
 
-    This is the "forked timeline" that explores a future scenario.
+    This is the "forked timeline" that explores a future scenario. The clone is
+    rebuilt from the numeric state snapshot alone; clones share no state with
+    each other, so they can run in separate worker processes.
 
     Args:
         initial_state: State snapshot from base twin
         scenario_schedule: Shift schedule for this scenario
         duration: Simulation duration (minutes)
+        seed: Random seed for this clone's generator (None for fresh entropy)
 
     Returns:
         dict: KPIs from this scenario
     """
-    print(f"\n{'='*70}")
-    print(f"Running FTRT Clone: {duration} minute simulation")
-    print(f"Shift schedule: {scenario_schedule}")
-    print(f"{'='*70}")
-
     # Create standard (non-realtime) environment for speed
     clone_env = simpy.Environment(initial_time=initial_state["simulation_time"])
 
     # Create factory clone with scenario
-    clone_factory = Factory(clone_env, scenario_schedule, verbose=False)
+    clone_factory = Factory(clone_env, scenario_schedule, verbose=False,
+                            rng=np.random.default_rng(seed))
 
     # Initialize from saved state
     clone_factory.run(initial_state=initial_state, duration=duration)
@@ -377,13 +469,42 @@ def run_predictive_clone(initial_state, scenario_schedule, duration=480):
         "average_technicians": sum(scenario_schedule.values()) / len(scenario_schedule),
     }
 
-    print(f"\nScenario complete!")
+    return kpis
+
+
+def run_predictive_clones(initial_state, scenario_schedules, duration=480):
+    """
+    Run one FTRT clone per scenario concurrently in a process pool.
+
+    Every clone is seeded with RANDOM_SEED (common random numbers), so KPI
+    differences come from the schedules rather than from sampling noise.
+
+    Args:
+        initial_state: State snapshot from base twin
+        scenario_schedules: List of shift schedules, one per scenario
+        duration: Simulation duration (minutes)
+
+    Returns:
+        list: KPI dicts, in the same order as scenario_schedules
+    """
+    with ProcessPoolExecutor(max_workers=len(scenario_schedules)) as executor:
+        futures = [
+            executor.submit(run_predictive_clone, initial_state, schedule, duration, RANDOM_SEED)
+            for schedule in scenario_schedules
+        ]
+        return [future.result() for future in futures]
+
+
+def print_clone_kpis(scenario_schedule, kpis, duration=480):
+    """Print the KPIs of a completed FTRT clone."""
+    print(f"\n{'='*70}")
+    print(f"FTRT Clone: {duration} minute simulation")
+    print(f"Shift schedule: {scenario_schedule}")
+    print(f"{'='*70}")
     print(f"  Parts produced:   {kpis['parts_produced']}")
     print(f"  Total downtime:   {kpis['total_downtime']:.1f} minutes")
     print(f"  Avg technicians:  {kpis['average_technicians']:.1f}")
 
-    return kpis
-
 
 # ========================================================================================
 # MAIN PREDICTIVE WORKFLOW
@@ -422,13 +543,16 @@ def operator_process(env, factory):
     print("🔮 LAUNCHING PREDICTIVE CLONES")
     print("="*70)
 
-    # Run baseline scenario (current plan)
+    # Run baseline (current plan) and proposed (alternative plan) clones concurrently
+    baseline_kpis, proposed_kpis = run_predictive_clones(
+        saved_state, [SCENARIO_BASELINE, SCENARIO_PROPOSED], duration=480
+    )
+
     print("\n--- SCENARIO 1: Baseline (Current Shift Schedule) ---")
-    baseline_kpis = run_predictive_clone(saved_state, SCENARIO_BASELINE, duration=480)
+    print_clone_kpis(SCENARIO_BASELINE, baseline_kpis, duration=480)
 
-    # Run proposed scenario (alternative plan)
     print("\n--- SCENARIO 2: Proposed (Enhanced Shift Schedule) ---")
-    proposed_kpis = run_predictive_clone(saved_state, SCENARIO_PROPOSED, duration=480)
+    print_clone_kpis(SCENARIO_PROPOSED, proposed_kpis, duration=480)
 
     # Compare scenarios
     print("\n" + "="*70)
@@ -487,15 +611,13 @@ def main():
     print("  4. KPI comparison for data-driven decisions")
     print("\n" + "="*70)
 
-    # Set random seed for reproducibility
-    random.seed(42)
-
     # Create real-time environment
     # factor < 1.0 means slower than wall-clock (more observable)
     rt_env = simpy.RealtimeEnvironment(factor=REALTIME_FACTOR, strict=False)
 
-    # Create base factory (uses baseline schedule initially)
-    base_factory = Factory(rt_env, SCENARIO_BASELINE, verbose=True)
+    # Create base factory (uses baseline schedule initially), seeded for reproducibility
+    base_factory = Factory(rt_env, SCENARIO_BASELINE, verbose=True,
+                           rng=np.random.default_rng(RANDOM_SEED))
 
     # Start operator process
     rt_env.process(operator_process(rt_env, base_factory))
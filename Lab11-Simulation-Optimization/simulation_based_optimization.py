@@ -13,6 +13,7 @@ Prerequisites:
     - simpy (discrete event simulation)
     - scipy (optimization algorithms)
     - numpy (numerical computing)
+    - numba (JIT-compiled simulation kernel for the optimizer)
 
 Usage:
     python simulation_based_optimization.py
@@ -25,9 +26,12 @@ What to observe:
 """
 
 import simpy
-import random
 import numpy as np
-from scipy.optimize import differential_evolution
+from numba import njit, prange
+from scipy.optimize import differential_evolution, OptimizeResult
+from scipy.stats import qmc
+from collections import OrderedDict, deque
+import itertools
 import time
 
 
@@ -54,14 +58,75 @@ LEAD_TIME_MIN = 3.0  # Minimum days for replenishment
 LEAD_TIME_MAX = 7.0  # Maximum days for replenishment
 
 # Optimization parameters
-N_REPLICATIONS = 5  # Number of simulation runs per policy evaluation
+N_REPLICATIONS = 3  # Number of simulation runs per policy evaluation
                     # More replications = more stable but slower
+                    # (common random numbers let us get away with fewer)
+CRN_BASE_SEED = 1000  # Replication r always uses seed CRN_BASE_SEED + r
+POLICY_CACHE_SIZE = 1024  # Most recently used policies whose costs are memoized
+
+# Bayesian optimization parameters (run_optimization(method='bayes'))
+BAYES_N_CALLS = 60      # Total policy evaluations
+BAYES_BATCH_SIZE = 10   # Policies proposed (and evaluated in parallel) per round
+
+
+# ========================================================================================
+# RANDOM VARIATE STREAMS
+# ========================================================================================
+
+def rand_vec_gen(np_dist, size=4096, **kwargs):
+    """
+    Yield random variates one at a time from batched NumPy draws.
+
+    Drawing `size` values per call amortizes the per-call overhead that
+    scalar sampling pays for every single event.
+
+    Args:
+        np_dist: Bound NumPy Generator method (e.g. rng.exponential)
+        size: Number of variates drawn per batch
+        **kwargs: Distribution parameters passed to np_dist
+
+    Yields:
+        Python scalars from the distribution
+    """
+    while True:
+        yield from np_dist(size=size, **kwargs).tolist()
 
 
 # ========================================================================================
 # INVENTORY SIMULATION MODEL
 # ========================================================================================
 
+class SimpleInventory:
+    """
+    Integer stock level with non-blocking get/put.
+
+    Stands in for simpy.Container: stock changes happen instantly, so there is no
+    need to schedule a SimPy event for every sale or delivery. Only the waiting
+    (arrivals, lead times, reviews) goes through the SimPy event queue.
+    """
+
+    def __init__(self, capacity, init=0):
+        """
+        Args:
+            capacity: Maximum stock level
+            init: Initial stock level
+        """
+        self.capacity = int(capacity)
+        self.level = int(init)
+
+    def try_get(self, qty):
+        """Remove up to qty units; returns the number actually removed."""
+        taken = min(self.level, qty)
+        self.level -= taken
+        return taken
+
+    def put(self, qty):
+        """Add up to qty units without exceeding capacity; returns the number added."""
+        added = min(self.capacity - self.level, qty)
+        self.level += added
+        return added
+
+
 class InventorySystem:
     """
     Stochastic inventory management simulation.
@@ -76,7 +141,7 @@ class InventorySystem:
     - Stockout: Penalty for lost sales
     """
 
-    def __init__(self, env, s, S, verbose=False):
+    def __init__(self, env, s, S, verbose=False, rng=None):
         """
         Initialize inventory system.
 
@@ -85,16 +150,23 @@ class InventorySystem:
             s: Reorder point (trigger level)
             S: Order-up-to level (target inventory)
             verbose: Print detailed logs
+            rng: NumPy random Generator (a fresh unseeded one if omitted)
         """
         self.env = env
         self.s = s  # Decision variable 1
         self.S = S  # Decision variable 2
         self.verbose = verbose
 
-        # Inventory (SimPy container)
+        # Random variate streams (batched NumPy draws, consumed one at a time)
+        rng = rng if rng is not None else np.random.default_rng()
+        self.inter_arrival_times = rand_vec_gen(rng.exponential, scale=1.0 / CUSTOMER_ARRIVAL_RATE)
+        self.order_sizes = rand_vec_gen(rng.integers, low=ORDER_SIZE_MIN, high=ORDER_SIZE_MAX + 1)
+        self.lead_times = rand_vec_gen(rng.uniform, low=LEAD_TIME_MIN, high=LEAD_TIME_MAX)
+
+        # Inventory (integer stock level, updated without SimPy events)
         # Initialize with minimum of INITIAL_INVENTORY and S (can't exceed capacity)
         initial_level = min(INITIAL_INVENTORY, S)
-        self.inventory = simpy.Container(env, capacity=S, init=initial_level)
+        self.inventory = SimpleInventory(capacity=S, init=initial_level)
 
         # Cost tracking
         self.total_holding_cost = 0.0
@@ -107,15 +179,22 @@ class InventorySystem:
         self.stockouts_count = 0
         self.lost_sales_units = 0
 
-        # For calculating average inventory
-        self.inventory_levels = []
-        self.inventory_times = []
+        # For calculating average inventory: time-weighted integral of the level,
+        # updated only when the level changes (it is constant in between)
+        self._inv_integral = 0.0
+        self._last_change_time = 0.0
 
     def _log(self, message):
         """Print log if verbose mode enabled."""
         if self.verbose:
             print(f"[Day {self.env.now:6.1f}] {message}")
 
+    def _accumulate_inventory(self):
+        """Add level × time since the last change to the inventory integral (call before changing level)."""
+        now = self.env.now
+        self._inv_integral += self.inventory.level * (now - self._last_change_time)
+        self._last_change_time = now
+
     def customer_process(self):
         """
         Generate customer demand (stochastic arrivals and order sizes).
@@ -125,17 +204,18 @@ class InventorySystem:
         """
         while True:
             # Wait for next customer arrival (exponential inter-arrival time)
-            inter_arrival = random.expovariate(CUSTOMER_ARRIVAL_RATE)
+            inter_arrival = next(self.inter_arrival_times)
             yield self.env.timeout(inter_arrival)
 
             # Customer places order (random size)
-            order_size = random.randint(ORDER_SIZE_MIN, ORDER_SIZE_MAX)
+            order_size = next(self.order_sizes)
 
             # Try to fulfill order
             available = self.inventory.level
             if available >= order_size:
                 # Sufficient inventory - fulfill order
-                yield self.inventory.get(order_size)
+                self._accumulate_inventory()
+                self.inventory.try_get(order_size)
                 self.units_sold += order_size
                 self._log(f"Customer: Sold {order_size} units (Inv: {self.inventory.level})")
 
@@ -146,7 +226,8 @@ class InventorySystem:
 
                 # Sell whatever we have
                 if available > 0:
-                    yield self.inventory.get(available)
+                    self._accumulate_inventory()
+                    self.inventory.try_get(available)
                     self.units_sold += available
 
                 self.lost_sales_units += lost_units
@@ -183,18 +264,16 @@ class InventorySystem:
                 self._log(f"Control: Placing order for {order_qty:.1f} units (Cost: ${ORDERING_COST})")
 
                 # Wait for random lead time
-                lead_time = random.uniform(LEAD_TIME_MIN, LEAD_TIME_MAX)
+                lead_time = next(self.lead_times)
                 yield self.env.timeout(lead_time)
 
                 # Order arrives - add to inventory
-                try:
-                    yield self.inventory.put(order_qty)
+                self._accumulate_inventory()
+                if self.inventory.put(order_qty) == order_qty:
                     self._log(f"Control: Order arrived ({order_qty:.1f} units). "
                              f"New inventory: {self.inventory.level:.1f}")
-                except simpy.ContainerOverflow:
+                else:
                     # Can't exceed capacity (shouldn't happen with proper S setting)
-                    actual_qty = self.inventory.capacity - self.inventory.level
-                    yield self.inventory.put(actual_qty)
                     self._log(f"Control: Order partially received (capacity limit)")
 
                 # Don't immediately reorder - wait a bit
@@ -204,21 +283,6 @@ class InventorySystem:
                 # Inventory above reorder point - check again later
                 yield self.env.timeout(1.0)  # Check daily
 
-    def monitoring_process(self):
-        """
-        Monitor inventory levels for calculating holding cost.
-
-        Records inventory level over time to compute time-weighted average.
-        Holding cost = average_inventory * cost_per_item_day * simulation_days
-        """
-        while True:
-            # Record current inventory level and time
-            self.inventory_levels.append(self.inventory.level)
-            self.inventory_times.append(self.env.now)
-
-            # Check daily
-            yield self.env.timeout(1.0)
-
     def calculate_total_cost(self):
         """
         Calculate total cost after simulation completes.
@@ -226,16 +290,12 @@ class InventorySystem:
         Returns:
             float: Total cost (holding + ordering + stockout)
         """
-        # Calculate time-weighted average inventory
-        if len(self.inventory_levels) > 1:
-            # Use trapezoidal rule for integration
-            avg_inventory = np.trapz(self.inventory_levels, self.inventory_times) / self.env.now
-        else:
-            avg_inventory = INITIAL_INVENTORY
+        # Close the final segment of the time-weighted inventory integral
+        self._accumulate_inventory()
 
         # Calculate holding cost
-        # Cost per item per day × average inventory × simulation duration
-        self.total_holding_cost = HOLDING_COST_PER_ITEM_DAY * avg_inventory * self.env.now
+        # Cost per item per day × item-days held (= average inventory × duration)
+        self.total_holding_cost = HOLDING_COST_PER_ITEM_DAY * self._inv_integral
 
         # Total cost is sum of all three components
         total_cost = (self.total_holding_cost +
@@ -257,7 +317,6 @@ class InventorySystem:
         # Start all processes
         self.env.process(self.customer_process())
         self.env.process(self.inventory_control_process())
-        self.env.process(self.monitoring_process())
 
         # Run simulation
         self.env.run(until=until)
@@ -266,12 +325,235 @@ class InventorySystem:
         return self.calculate_total_cost()
 
 
+# ========================================================================================
+# COMPILED SIMULATION KERNEL (USED BY THE OPTIMIZER)
+# ========================================================================================
+
+# batch_simulate is declared with an explicit signature, so Numba compiles it (and the
+# simulate_inventory_cost specialization it calls) eagerly when this module is imported,
+# or loads it from the __pycache__ cache, instead of on the first optimizer evaluation.
+# simulate_inventory_cost itself stays lazily typed, so direct calls may omit `until`
+# and pass any integer dtype for order_sizes.
+
+@njit(cache=True)
+def simulate_inventory_cost(s, S, arrival_times, order_sizes, lead_times, until=SIMULATION_DAYS):
+    """
+    Numba-compiled equivalent of InventorySystem.run_simulation().
+
+    Same (s,S) logic as the SimPy model, but all random inputs are sampled up
+    front and the kernel simply marches through the next event in time order:
+    a customer arrival, the daily inventory review, or a replenishment arrival.
+    The holding cost uses the exact time-weighted inventory integral.
+
+    Args:
+        s: Reorder point (trigger level, whole units)
+        S: Order-up-to level (target inventory, whole units)
+        arrival_times: Sorted customer arrival times (days)
+        order_sizes: Customer order sizes, one per arrival
+        lead_times: Replenishment lead times, consumed one per order placed
+        until: Simulation duration (days)
+
+    Returns:
+        float: Total cost (holding + ordering + stockout)
+    """
+    inventory_level = min(INITIAL_INVENTORY, S)
+    inventory_integral = 0.0  # Integral of inventory level over time (item-days)
+    last_event_time = 0.0
+    total_ordering_cost = 0.0
+    total_stockout_cost = 0.0
+
+    next_review_time = 0.0    # Control process checks inventory at t=0, then daily
+    order_pending = False
+    order_arrival_time = 0.0
+    order_qty = 0
+    orders_placed = 0
+
+    n_customers = arrival_times.shape[0]
+
+    # One pass per customer; the extra final pass (customer_time = +inf) only drains
+    # the control events left between the last arrival and the end of the horizon
+    for customer in range(n_customers + 1):
+        customer_time = arrival_times[customer] if customer < n_customers else np.inf
+
+        # Control events due before this customer: order arrival if one is
+        # outstanding, else a review
+        while True:
+            control_time = order_arrival_time if order_pending else next_review_time
+            if control_time > customer_time or control_time >= until:
+                break
+
+            # Accumulate holding integral up to this event
+            inventory_integral += inventory_level * (control_time - last_event_time)
+            last_event_time = control_time
+
+            if order_pending:
+                # Order arrives - add to inventory, re-check shortly after
+                inventory_level += order_qty
+                order_pending = False
+                next_review_time = control_time + 0.1
+            elif inventory_level < s:
+                # Below reorder point - place order!
+                order_qty = S - inventory_level
+                total_ordering_cost += ORDERING_COST
+                order_arrival_time = control_time + lead_times[orders_placed]
+                orders_placed += 1
+                order_pending = True
+            else:
+                # Inventory above reorder point - check again tomorrow
+                next_review_time = control_time + 1.0
+
+        if customer_time >= until:
+            break
+
+        # Accumulate holding integral up to this arrival
+        inventory_integral += inventory_level * (customer_time - last_event_time)
+        last_event_time = customer_time
+
+        # Customer places order; any shortfall is a lost sale
+        order_size = order_sizes[customer]
+        fulfilled = min(inventory_level, order_size)
+        inventory_level -= fulfilled
+        total_stockout_cost += (order_size - fulfilled) * STOCKOUT_COST_PER_ITEM
+
+    # Close the final segment of the holding integral
+    inventory_integral += inventory_level * (until - last_event_time)
+    total_holding_cost = HOLDING_COST_PER_ITEM_DAY * inventory_integral
+
+    return total_holding_cost + total_ordering_cost + total_stockout_cost
+
+
+@njit("void(i4[::1], i4[::1], f8[:, ::1], i4[:, ::1], f8[:, ::1], f8[:, ::1])",
+      parallel=True, cache=True)
+def batch_simulate(s_values, S_values, arrival_times, order_sizes, lead_times, costs):
+    """
+    Simulate every (policy, replication) pair in parallel, writing into costs.
+
+    The replications are stored struct-of-arrays style: row r of each 2-D input
+    array holds replication r's events, so a single compiled call walks every
+    scenario without creating any per-replication Python objects. The flattened
+    policies x replications loop is spread over all CPU cores with prange.
+
+    Args:
+        s_values: (n_policies,) reorder points
+        S_values: (n_policies,) order-up-to levels
+        arrival_times: (n_reps, n_arrivals) arrival times, padded with +inf
+        order_sizes: (n_reps, n_arrivals) customer order sizes
+        lead_times: (n_reps, max_orders) replenishment lead times
+        costs: (n_policies, n_reps) output array of total cost per run
+    """
+    n_reps = arrival_times.shape[0]
+    for k in prange(s_values.shape[0] * n_reps):
+        policy = k // n_reps
+        rep = k % n_reps
+        costs[policy, rep] = simulate_inventory_cost(s_values[policy], S_values[policy],
+                                                     arrival_times[rep], order_sizes[rep],
+                                                     lead_times[rep], SIMULATION_DAYS)
+
+
+def sample_replication_inputs(seeds, until=SIMULATION_DAYS):
+    """
+    Sample every random input the kernel needs, one replication per seed.
+
+    The three event arrays are allocated once (one row per replication) and each
+    replication's variates are drawn straight into its row, with no per-replication
+    temporaries to copy. Arrival counts differ between replications, so shorter rows
+    are padded with arrivals at +inf, which the kernel never reaches.
+
+    Args:
+        seeds: One random seed per replication
+        until: Simulation duration (days)
+
+    Returns:
+        tuple: (arrival_times, order_sizes, lead_times) 2-D arrays
+    """
+    rngs = [np.random.default_rng(seed) for seed in seeds]
+
+    # Customer arrivals: a Poisson number of arrivals placed uniformly over the
+    # horizon is exactly a Poisson process, so the arrays are sized once, no refills
+    n_arrivals = [rng.poisson(CUSTOMER_ARRIVAL_RATE * until) for rng in rngs]
+
+    # At most one order is outstanding, so orders are at least LEAD_TIME_MIN days apart
+    max_orders = int(until / LEAD_TIME_MIN) + 1
+
+    arrival_times = np.full((len(seeds), max(n_arrivals)), np.inf)
+    order_sizes = np.zeros((len(seeds), max(n_arrivals)), dtype=np.int32)
+    lead_times = np.empty((len(seeds), max_orders))
+
+    for rep, (rng, n) in enumerate(zip(rngs, n_arrivals)):
+        arrivals = arrival_times[rep, :n]
+        rng.random(out=arrivals)
+        arrivals *= until
+        arrivals.sort()
+
+        order_sizes[rep, :n] = rng.integers(ORDER_SIZE_MIN, ORDER_SIZE_MAX + 1, size=n, dtype=np.int32)
+
+        leads = lead_times[rep]
+        rng.random(out=leads)
+        leads *= LEAD_TIME_MAX - LEAD_TIME_MIN
+        leads += LEAD_TIME_MIN
+
+    return arrival_times, order_sizes, lead_times
+
+
 # ========================================================================================
 # OPTIMIZATION WRAPPER (OBJECTIVE FUNCTION)
 # ========================================================================================
 
-# Global counter for tracking function evaluations
-evaluation_counter = 0
+# Evaluated policies (s, S, mean cost, std of cost) waiting to be printed. The
+# objective only appends here; the optimizer callback prints once per generation
+# so terminal I/O stays out of the evaluation loop.
+_evaluation_log = deque()
+
+# COMMON RANDOM NUMBERS (CRN)
+# Every candidate policy is evaluated against the same demand/lead-time scenarios,
+# so cost differences between policies come from the policies, not from luck.
+# The scenarios are sampled once at import and reused by every evaluation.
+REPLICATION_ARRIVAL_TIMES, REPLICATION_ORDER_SIZES, REPLICATION_LEAD_TIMES = sample_replication_inputs(
+    [CRN_BASE_SEED + rep for rep in range(N_REPLICATIONS)]
+)
+
+# Memoized policy costs: (s, S) -> (mean cost, std of cost), least recently used first.
+# Because all policies share the same scenarios, repeating a policy gives exactly the
+# same costs - so DE trial vectors that round to an already-seen (s, S) are answered
+# from the cache instead of being re-simulated.
+_policy_cache = OrderedDict()
+
+
+def _evaluate_policies(s_values, S_values):
+    """
+    Simulate a batch of policies on every CRN scenario (memoized).
+
+    Args:
+        s_values: int32 array of reorder points
+        S_values: int32 array of order-up-to levels
+
+    Returns:
+        list: (mean cost, std of cost) across replications, one tuple per policy
+    """
+    keys = list(zip(s_values.tolist(), S_values.tolist()))
+
+    # Simulate each policy not yet in the cache once, all in one parallel call
+    missing = list(dict.fromkeys(key for key in keys if key not in _policy_cache))
+    if missing:
+        missing_s, missing_S = (np.array(levels, dtype=np.int32) for levels in zip(*missing))
+        costs = np.empty((len(missing), N_REPLICATIONS))
+        # batch_simulate is compiled for int32 order sizes; cast here (a no-op for the
+        # sampled arrays) rather than relying on every producer matching the dtype
+        batch_simulate(missing_s, missing_S, REPLICATION_ARRIVAL_TIMES,
+                       np.ascontiguousarray(REPLICATION_ORDER_SIZES, dtype=np.int32),
+                       REPLICATION_LEAD_TIMES, costs)
+        for key, mean, std in zip(missing, costs.mean(axis=1), costs.std(axis=1)):
+            _policy_cache[key] = (mean, std)
+
+    results = []
+    for key in keys:
+        _policy_cache.move_to_end(key)
+        results.append(_policy_cache[key])
+
+    while len(_policy_cache) > POLICY_CACHE_SIZE:
+        _policy_cache.popitem(last=False)
+
+    return results
 
 
 def objective_function(decision_variables):
@@ -282,74 +564,115 @@ def objective_function(decision_variables):
     Takes candidate policy parameters, runs stochastic simulation multiple times,
     and returns average cost.
 
+    The function is vectorized: DE (vectorized=True) passes a whole generation of
+    trial vectors at once, and the simulations for all of them run in one call.
+
     Args:
-        decision_variables: Array [s, S] - reorder point and order-up-to level
+        decision_variables: Array [s, S] for one policy, or array of shape (2, M)
+                            with one (s, S) policy per column
 
     Returns:
-        float: Average total cost across replications (lower is better)
+        float or ndarray: Average total cost across replications for each policy
+                          (lower is better)
     """
-    global evaluation_counter
-    evaluation_counter += 1
-
-    # Unpack decision variables
-    s, S = decision_variables
+    # Unpack decision variables - policy levels are whole units, so round to integers
+    # (DE already proposes integers; the Bayesian optimizer proposes real values)
+    policies = np.asarray(decision_variables, dtype=float)
+    single_policy = policies.ndim == 1
+    s_values, S_values = np.rint(policies.reshape(2, -1)).astype(np.int32)
 
-    # CONSTRAINT ENFORCEMENT: s must be less than S
-    if s >= S:
-        # Invalid policy - return very high penalty cost
-        return 1e9
-
-    # Additional constraint: Ensure both are positive
-    if s < 0 or S < 0:
-        return 1e9
+    # CONSTRAINT ENFORCEMENT: s must be less than S, and both positive
+    # Invalid policies get a very high penalty cost instead of being simulated
+    valid = (s_values < S_values) & (s_values >= 0)
+    avg_costs = np.full(s_values.shape[0], 1e9)
 
     # RUN MULTIPLE REPLICATIONS
     # Because simulation is stochastic, we need multiple runs to get stable average
-    replication_costs = []
-
-    for rep in range(N_REPLICATIONS):
-        # Set different random seed for each replication
-        random.seed(42 + evaluation_counter * 1000 + rep)
+    results = _evaluate_policies(s_values[valid], S_values[valid])
 
-        # Create new simulation environment
-        env = simpy.Environment()
+    for index, s, S, (avg_cost, std_cost) in zip(np.flatnonzero(valid), s_values[valid],
+                                                  S_values[valid], results):
+        avg_costs[index] = avg_cost
 
-        # Create inventory system with these parameters
-        inv_system = InventorySystem(env, s=s, S=S, verbose=False)
+        # Log progress (printed later by flush_evaluation_log)
+        _evaluation_log.append((s, S, avg_cost, std_cost))
 
-        # Run simulation and get total cost
-        cost = inv_system.run_simulation(until=SIMULATION_DAYS)
-
-        # Store result
-        replication_costs.append(cost)
+    # Return average cost (optimizer will minimize this)
+    return avg_costs[0] if single_policy else avg_costs
 
-    # Calculate average cost across replications
-    avg_cost = np.mean(replication_costs)
-    std_cost = np.std(replication_costs)
 
-    # Log progress
-    print(f"Eval {evaluation_counter:4d}: (s={s:6.1f}, S={S:6.1f}) → "
-          f"Cost: ${avg_cost:10,.2f} ± ${std_cost:7,.2f}")
+def flush_evaluation_log(eval_numbers):
+    """
+    Print and clear the buffered evaluation log.
 
-    # Return average cost (optimizer will minimize this)
-    return avg_cost
+    Args:
+        eval_numbers: itertools.count() supplying the running evaluation number
+    """
+    lines = []
+    while _evaluation_log:
+        s, S, avg_cost, std_cost = _evaluation_log.popleft()
+        lines.append(f"Eval {next(eval_numbers):4d}: (s={s:4d}, S={S:4d}) → "
+                     f"Cost: ${avg_cost:10,.2f} ± ${std_cost:7,.2f}")
+    if lines:
+        print("\n".join(lines))
 
 
 # ========================================================================================
 # OPTIMIZATION ENGINE
 # ========================================================================================
 
-def run_optimization():
+def run_bayesian_optimization(bounds, callback=None):
     """
-    Run simulation-based optimization using differential evolution.
+    Minimize the objective with batch Bayesian optimization.
+
+    A Gaussian-process surrogate of the cost surface picks the next batch of
+    promising policies, so far fewer simulations are needed than with an
+    evolutionary search. Each batch is evaluated in parallel.
+
+    Requires scikit-optimize (pip install scikit-optimize).
+
+    Args:
+        bounds: List of (low, high) bounds for [s, S]
+        callback: Optional callable, called with no arguments after each batch
+
+    Returns:
+        OptimizeResult: Best policy found (x, fun, nfev, success)
+    """
+    from skopt import Optimizer  # Optional dependency, only needed for method='bayes'
+
+    optimizer = Optimizer(bounds, base_estimator="GP", acq_func="EI",
+                          n_initial_points=BAYES_BATCH_SIZE, random_state=42)
+
+    for _ in range(BAYES_N_CALLS // BAYES_BATCH_SIZE):
+        candidates = optimizer.ask(n_points=BAYES_BATCH_SIZE)
+        costs = objective_function(np.array(candidates, dtype=float).T)
+        optimizer.tell(candidates, costs.tolist())
+        if callback is not None:
+            callback()
+
+    skopt_result = optimizer.get_result()
+    return OptimizeResult(x=np.array(skopt_result.x), fun=skopt_result.fun,
+                          nfev=len(skopt_result.func_vals), success=True)
+
+
+def run_optimization(method="de"):
+    """
+    Run simulation-based optimization.
 
     Differential evolution is a population-based stochastic optimizer
     (similar to genetic algorithms) that's well-suited for noisy,
     non-convex objective functions like simulation models.
 
+    Args:
+        method: 'de' for differential evolution (default) or 'bayes' for
+                Gaussian-process Bayesian optimization (fewer evaluations)
+
     Returns:
         OptimizeResult: Optimization results including optimal parameters
     """
+    if method not in ("de", "bayes"):
+        raise ValueError(f"Unknown optimization method: {method!r} (expected 'de' or 'bayes')")
+
     print("\n" + "="*80)
     print("SIMULATION-BASED OPTIMIZATION: Finding Optimal Inventory Policy")
     print("="*80)
@@ -377,30 +700,51 @@ def run_optimization():
     print(f"    S ∈ [{bounds[1][0]}, {bounds[1][1]}]")
 
     print("\n" + "="*80)
-    print("Starting Differential Evolution Optimizer...")
+    if method == "bayes":
+        print("Starting Bayesian Optimizer...")
+    else:
+        print("Starting Differential Evolution Optimizer...")
     print("="*80)
     print()
 
+    # Numbers the evaluation log lines; printed once per generation / batch
+    eval_numbers = itertools.count(1)
+
     # Start timer
     start_time = time.time()
 
-    # Run differential evolution optimizer
-    result = differential_evolution(
-        func=objective_function,          # Function to minimize
-        bounds=bounds,                    # Search space
-        strategy='best1bin',              # DE strategy
-        maxiter=30,                       # Maximum iterations (generations)
-        popsize=10,                       # Population size (10 * 2 vars = 20 individuals)
-        tol=0.01,                         # Tolerance for convergence
-        atol=100,                         # Absolute tolerance
-        mutation=(0.5, 1.5),             # Mutation factor range
-        recombination=0.7,               # Crossover probability
-        seed=42,                         # Random seed for reproducibility
-        disp=True,                       # Display progress
-        polish=True,                     # Local optimization at end
-        workers=1,                       # Use single worker (simulation not thread-safe)
-        updating='deferred',             # Update population after full generation
-    )
+    if method == "bayes":
+        # Run Gaussian-process Bayesian optimizer
+        result = run_bayesian_optimization(
+            bounds, callback=lambda: flush_evaluation_log(eval_numbers))
+    else:
+        # Initial population: 2^5 = 32 scrambled Sobol points, spread evenly over the
+        # search space (and reproducible), evaluated as one batch before generation 1
+        lower, upper = np.array(bounds, dtype=float).T
+        sobol_points = qmc.scale(qmc.Sobol(d=2, seed=42).random_base2(m=5), lower, upper)
+
+        # Run differential evolution optimizer
+        result = differential_evolution(
+            func=objective_function,          # Function to minimize
+            bounds=bounds,                    # Search space
+            strategy='best1bin',              # DE strategy
+            maxiter=30,                       # Maximum iterations (generations)
+            init=sobol_points,                # Initial population (32 individuals, overrides popsize)
+            tol=0.01,                         # Tolerance for convergence
+            atol=100,                         # Absolute tolerance
+            mutation=(0.5, 1.5),             # Mutation factor range
+            recombination=0.7,               # Crossover probability
+            seed=42,                         # Random seed for reproducibility
+            disp=True,                       # Display progress
+            polish=False,                    # No gradient-based polish on an integer lattice
+            integrality=[True, True],        # s and S are whole units of stock
+            vectorized=True,                 # Evaluate a whole generation in one objective call
+            updating='deferred',             # Update population after full generation (required for vectorized)
+            callback=lambda xk, convergence: flush_evaluation_log(eval_numbers),  # Print log per generation
+        )
+
+    # Print evaluations made after the last generation (e.g. while polishing)
+    flush_evaluation_log(eval_numbers)
 
     # End timer
     elapsed_time = time.time() - start_time
@@ -415,7 +759,8 @@ def run_optimization():
     minimum_cost = result.fun
 
     print(f"\nOptimization Summary:")
-    print(f"  Total evaluations: {evaluation_counter}")
+    print(f"  Objective calls:   {result.nfev}")
+    print(f"  Total evaluations: {next(eval_numbers) - 1}")
     print(f"  Time elapsed:      {elapsed_time:.1f} seconds")
     print(f"  Convergence:       {'Success' if result.success else 'Did not converge'}")
 
@@ -431,9 +776,9 @@ def run_optimization():
     print("Cost Breakdown (using optimal policy):")
     print("="*80)
 
-    random.seed(42)
     env = simpy.Environment()
-    final_system = InventorySystem(env, s=optimal_s, S=optimal_S, verbose=False)
+    final_system = InventorySystem(env, s=round(optimal_s), S=round(optimal_S), verbose=False,
+                                   rng=np.random.default_rng(42))
     final_cost = final_system.run_simulation(until=SIMULATION_DAYS)
 
     print(f"\n  Holding Cost:   ${final_system.total_holding_cost:10,.2f} "
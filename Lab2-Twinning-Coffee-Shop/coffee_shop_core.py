@@ -0,0 +1,421 @@
+"""
+Lab 2: Twinning a Coffee Shop - Shared DES Model
+================================================
+
+The CoffeeShop model used by both entry points:
+    - coffee_shop_simulation.py: standard simpy.Environment (runs as fast as possible)
+    - coffee_shop_simulation_realtime.py: simpy.rt.RealtimeEnvironment (wall-clock paced)
+
+The model never reads run configuration from module globals; each script passes its
+own simulation length, service-time distribution and seed to CoffeeShop().
+"""
+
+import simpy
+import queue
+import itertools
+import numpy as np
+
+ARRIVAL_BATCH_SIZE = 4096      # Inter-arrival variates drawn per NumPy call
+SERVICE_BATCH_SIZE = 4096      # Service-time variates drawn per NumPy call
+CONTROL_POLL_INTERVAL = 0.1    # How often queued control commands are applied (minutes)
+WAIT_BUFFER_MARGIN = 4         # Wait-time slots preallocated per expected customer
+
+
+# ========================================================================================
+# PHASE 1 & 2: COFFEE SHOP CLASS - DES MODEL WITH INSTRUMENTATION
+# ========================================================================================
+
+class CoffeeShop:
+    """
+    Encapsulates the discrete-event simulation of a coffee shop.
+
+    This class represents the simulation model, managing:
+    - The SimPy environment (simulation clock and event scheduler)
+    - Barista resources (a simpy.Resource whose capacity can change)
+    - Customer generation and processing
+    - Data collection for statistics
+
+    Phase 2 adds instrumentation methods for dynamic parameter updates.
+    """
+
+    def __init__(self, env, num_baristas, mean_interarrival, sim_time,
+                 service_time_min, service_time_mode, service_time_max,
+                 seed=None, debug=False, verbose=False):
+        """
+        Initialize the coffee shop simulation environment.
+
+        Args:
+            env: SimPy environment instance (simpy.Environment or
+                simpy.rt.RealtimeEnvironment)
+            num_baristas: Initial number of barista resources
+            mean_interarrival: Mean time between customer arrivals (exponential distribution)
+            sim_time: Simulation length (minutes); no customers arrive after it
+            service_time_min: Minimum service time (minutes, triangular distribution)
+            service_time_mode: Most likely service time (minutes)
+            service_time_max: Maximum service time (minutes)
+            seed: Seed for the inter-arrival and service-time random stream
+            debug: Trace mode: record customer events as raw tuples for print_event_log()
+            verbose: Print customer and control events as they happen. Off by default:
+                the messages are then never formatted, which keeps long or repeated
+                runs free of string-formatting and terminal I/O costs
+        """
+        # Core simulation components
+        self.env = env
+        self.sim_time = sim_time
+        self.service_time_min = service_time_min
+        self.service_time_mode = service_time_mode
+        self.service_time_max = service_time_max
+
+        # RESOURCE MANAGEMENT (Phase 2 design):
+        # A simpy.Resource with one unit of capacity per barista. Customers "seize"
+        # (request) and "release" a unit; add_barista/remove_barista change the
+        # capacity at runtime (see below).
+        self.baristas = simpy.Resource(env, capacity=num_baristas)
+
+        # DYNAMIC PARAMETERS (Phase 2 instrumentation):
+        # These can be modified during simulation runtime
+        self.mean_interarrival = mean_interarrival
+        self.current_barista_count = num_baristas
+
+        # RANDOM ARRIVALS AND SERVICE TIMES:
+        # Unit-mean exponentials drawn in NumPy batches and scaled by the *current*
+        # mean on use, so a rate change applies to the very next arrival.
+        # Service times are drawn in batches from the same generator.
+        self._rng = np.random.default_rng(seed)
+        self._unit_interarrivals = iter(())
+        self._svc_buf = iter(())
+
+        # DATA COLLECTION:
+        # Store metrics for final analysis
+        # Customer waiting times: a buffer sized from the expected arrival count
+        # (doubled if a rate change ever fills it) and a fill index
+        expected_customers = int(sim_time / mean_interarrival) + 1
+        self._wait_buffer = np.empty(expected_customers * WAIT_BUFFER_MARGIN, dtype=np.float64)
+        self._n_waits = 0
+        self.customers_served = 0       # Total customers who completed service
+        self._customer_ids = itertools.count(1)  # Unique customer IDs: 1, 2, ...
+
+        # EVENT LOG:
+        # (time, customer_id, event, minutes) tuples, formatted only after the run so
+        # the simulation loop never pays for string formatting or terminal I/O
+        self.debug = debug
+        self.verbose = verbose
+        self._log = []
+
+        # CONTROL MAILBOX (Phase 3):
+        # External threads queue commands here; control_listener() applies them on
+        # the simulation thread, so model state is never shared between threads
+        self._control_queue = queue.SimpleQueue()
+        env.process(self.control_listener())
+
+    # ====================================================================================
+    # PHASE 1: CORE SIMULATION PROCESSES
+    # ====================================================================================
+
+    def customer(self, customer_id):
+        """
+        Defines the lifecycle of a single customer entity (Process-Interaction Worldview).
+
+        Customer Process Flow:
+            1. Arrive at coffee shop
+            2. Request (seize) a barista resource
+            3. Wait in queue if all baristas are busy (implicit in Resource.request())
+            4. Receive service (modeled as a time delay)
+            5. Release the barista resource
+            6. Leave the system
+
+        Args:
+            customer_id: Unique identifier for this customer entity
+        """
+        # Local alias: the clock and timeout are read at every step of the process
+        env = self.env
+
+        # EVENT 1: ARRIVAL
+        arrival_time = env.now
+        if self.debug:
+            self._log.append((arrival_time, customer_id, "ARRIVES", None))
+        if self.verbose:
+            print(f"[{arrival_time:6.2f}] Customer {customer_id:3d} | ARRIVES")
+
+        # EVENT 2: REQUEST BARISTA (Resource Seize)
+        # The customer requests a barista from the resource
+        # If no baristas are available, this creates an implicit queue (customer waits)
+        with self.baristas.request() as request:
+            yield request
+
+            # EVENT 3: SERVICE BEGINS
+            # Calculate wait time (time from arrival until service starts)
+            wait_time = env.now - arrival_time
+
+            self._record_wait(wait_time)
+
+            if self.debug:
+                self._log.append((env.now, customer_id, "STARTS SERVICE", wait_time))
+            if self.verbose:
+                print(f"[{env.now:6.2f}] Customer {customer_id:3d} | STARTS SERVICE "
+                      f"(waited {wait_time:.2f} min)")
+
+            # EVENT 4: SERVICE DELAY
+            # Service time follows a Triangular distribution (min, mode, max)
+            # This represents the stochastic nature of real-world service times
+            service_time = self._next_service()
+            yield env.timeout(service_time)
+
+        # EVENT 5: RELEASE BARISTA (Resource Release)
+        # Leaving the "with" block released the barista for the next customer
+
+        # EVENT 6: DEPARTURE
+        if self.debug:
+            self._log.append((env.now, customer_id, "LEAVES", service_time))
+        if self.verbose:
+            print(f"[{env.now:6.2f}] Customer {customer_id:3d} | LEAVES "
+                  f"(service took {service_time:.2f} min)")
+
+        self.customers_served += 1
+
+    def setup(self):
+        """
+        Customer generator process (Entity Creation).
+
+        This is the main driver of the simulation. It continuously creates new
+        customer entities at stochastic intervals following an exponential distribution.
+
+        The exponential distribution models random, memoryless arrivals (Poisson process),
+        which is appropriate for modeling customer arrivals in service systems.
+        """
+        print("\n" + "="*80)
+        print("COFFEE SHOP SIMULATION STARTING")
+        print("="*80)
+        print(f"Configuration: {self.current_barista_count} baristas, "
+              f"mean inter-arrival = {self.mean_interarrival:.2f} min")
+        print("="*80 + "\n")
+
+        while True:
+            # Generate inter-arrival time (exponentially distributed)
+            # This represents the time until the next customer arrives
+            interarrival_time = self._next_interarrival()
+
+            # Wait for the next arrival
+            yield self.env.timeout(interarrival_time)
+
+            # Check if we've exceeded the simulation time
+            if self.env.now > self.sim_time:
+                break
+
+            # Create a new customer entity
+            customer_id = next(self._customer_ids)
+
+            # Start the customer's process
+            self.env.process(self.customer(customer_id))
+
+    def _next_interarrival(self):
+        """
+        Draw the next exponential inter-arrival time at the current mean.
+
+        Refills a batch of ARRIVAL_BATCH_SIZE unit-mean variates from NumPy when
+        the previous batch is used up.
+        """
+        unit_draw = next(self._unit_interarrivals, None)
+        if unit_draw is None:
+            self._unit_interarrivals = iter(
+                self._rng.standard_exponential(ARRIVAL_BATCH_SIZE).tolist())
+            unit_draw = next(self._unit_interarrivals)
+        return unit_draw * self.mean_interarrival
+
+    def _record_wait(self, wait_time):
+        """Store a waiting time, growing the buffer in the rare case it is full."""
+        if self._n_waits == len(self._wait_buffer):
+            self._wait_buffer = np.concatenate(
+                (self._wait_buffer, np.empty_like(self._wait_buffer)))
+        self._wait_buffer[self._n_waits] = wait_time
+        self._n_waits += 1
+
+    @property
+    def wait_times(self):
+        """Recorded customer waiting times (a view, no copy)."""
+        return self._wait_buffer[:self._n_waits]
+
+    def _next_service(self):
+        """
+        Draw the next triangular service time.
+
+        Refills a batch of SERVICE_BATCH_SIZE variates from NumPy when the previous
+        batch is used up.
+        """
+        service_time = next(self._svc_buf, None)
+        if service_time is None:
+            self._svc_buf = iter(self._rng.triangular(
+                self.service_time_min, self.service_time_mode, self.service_time_max,
+                SERVICE_BATCH_SIZE).tolist())
+            service_time = next(self._svc_buf)
+        return service_time
+
+    # ====================================================================================
+    # PHASE 2: INSTRUMENTATION METHODS FOR TWINNING
+    # ====================================================================================
+
+    def set_arrival_rate(self, new_mean_interarrival):
+        """
+        Dynamically adjust the customer arrival rate during simulation.
+
+        This represents updating the simulation based on real-time data.
+        For example, a sensor might detect increased foot traffic, or
+        historical data might indicate a lunch rush is starting.
+
+        Safe to call from another thread: the change is queued and applied by
+        the simulation at its next control poll.
+
+        Args:
+            new_mean_interarrival: New mean time between arrivals (minutes)
+        """
+        self._control_queue.put(("rate", new_mean_interarrival))
+
+    def add_barista(self):
+        """
+        Dynamically add a new barista resource during simulation.
+
+        This simulates real-world events like a new employee starting their shift
+        or additional staff being called in during peak hours.
+
+        Safe to call from another thread: the change is queued and applied by
+        the simulation at its next control poll.
+        """
+        self._control_queue.put(("add_barista", None))
+
+    def remove_barista(self):
+        """
+        Dynamically remove a barista resource during simulation.
+
+        This simulates events like an employee going on break or ending their shift.
+
+        Safe to call from another thread: the change is queued and applied by
+        the simulation at its next control poll.
+        """
+        self._control_queue.put(("remove_barista", None))
+
+    def control_listener(self):
+        """
+        Control process: applies queued instrumentation commands inside the simulation.
+
+        External threads only ever put commands on the queue; this process is the
+        single place model state is changed on their behalf. Because every
+        SimPy process runs on the simulation thread, no locks are needed.
+        """
+        handlers = {
+            "rate": self._apply_arrival_rate,
+            "add_barista": self._apply_add_barista,
+            "remove_barista": self._apply_remove_barista,
+        }
+
+        while True:
+            yield self.env.timeout(CONTROL_POLL_INTERVAL)
+
+            while not self._control_queue.empty():
+                command, argument = self._control_queue.get_nowait()
+                handlers[command](argument)
+
+    def _apply_arrival_rate(self, new_mean_interarrival):
+        """Change the mean inter-arrival time (runs inside the simulation)."""
+        old_rate = self.mean_interarrival
+        self.mean_interarrival = new_mean_interarrival
+
+        if self.verbose:
+            print(f"\n{'*'*80}")
+            print(f"[{self.env.now:6.2f}] CONTROL EVENT | Arrival rate changed: "
+                  f"{old_rate:.2f} min -> {new_mean_interarrival:.2f} min")
+            print(f"{'*'*80}\n")
+
+    def _apply_add_barista(self, _):
+        """
+        Add a barista (runs inside the simulation).
+
+        Implementation: Raises the resource capacity by one and lets the next
+        queued customer (if any) seize the new barista.
+        """
+        self.current_barista_count += 1
+
+        # Add the new barista to the resource (becomes immediately available)
+        self.baristas._capacity += 1
+        self.baristas._trigger_put(None)
+
+        if self.verbose:
+            print(f"\n{'*'*80}")
+            print(f"[{self.env.now:6.2f}] CONTROL EVENT | New barista added. "
+                  f"Total baristas: {self.current_barista_count}")
+            print(f"{'*'*80}\n")
+
+    def _apply_remove_barista(self, _):
+        """
+        Remove a barista (runs inside the simulation).
+
+        IMPORTANT: We don't forcibly remove a barista who is serving a customer.
+        Instead, we request a barista from the resource like a customer would, then
+        retire that unit of capacity. This ensures the barista finishes their
+        current service before being removed (realistic behavior).
+        """
+        if self.verbose:
+            print(f"\n{'*'*80}")
+            print(f"[{self.env.now:6.2f}] CONTROL EVENT | Attempting to remove a barista...")
+            print(f"{'*'*80}\n")
+
+        # This will wait if all baristas are busy (realistic - can't remove a busy barista)
+        def removal_process():
+            request = self.baristas.request()
+            yield request
+
+            # Retire the seized barista: drop its capacity unit without releasing it
+            self.baristas._capacity -= 1
+            self.baristas.users.remove(request)
+            self.current_barista_count -= 1
+
+            if self.verbose:
+                print(f"\n{'*'*80}")
+                print(f"[{self.env.now:6.2f}] CONTROL EVENT | Barista removed. "
+                      f"Total baristas: {self.current_barista_count}")
+                print(f"{'*'*80}\n")
+
+        self.env.process(removal_process())
+
+    # ====================================================================================
+    # STATISTICS AND REPORTING
+    # ====================================================================================
+
+    def print_event_log(self):
+        """
+        Format and print the recorded customer events (requires debug=True).
+        """
+        details = {
+            "ARRIVES": "",
+            "STARTS SERVICE": " (waited {:.2f} min)",
+            "LEAVES": " (service took {:.2f} min)",
+        }
+        lines = [
+            f"[{now:6.2f}] Customer {customer_id:3d} | {event}" + details[event].format(minutes)
+            for now, customer_id, event, minutes in self._log
+        ]
+        print("\n".join(lines))
+
+    def print_statistics(self):
+        """
+        Calculate and display final simulation statistics.
+        """
+        print("\n" + "="*80)
+        print("SIMULATION COMPLETE - FINAL STATISTICS")
+        print("="*80)
+        print(f"Simulation Time:          {self.sim_time} minutes")
+        print(f"Customers Served:         {self.customers_served}")
+        print(f"Final Barista Count:      {self.current_barista_count}")
+
+        if self._n_waits:
+            waits = self.wait_times
+            avg_wait = waits.mean()
+            max_wait = waits.max()
+            min_wait = waits.min()
+            print(f"\nWaiting Time Statistics:")
+            print(f"  Average Wait Time:      {avg_wait:.2f} minutes")
+            print(f"  Maximum Wait Time:      {max_wait:.2f} minutes")
+            print(f"  Minimum Wait Time:      {min_wait:.2f} minutes")
+        else:
+            print("\nNo customers were served during the simulation.")
+
+        print("="*80 + "\n")
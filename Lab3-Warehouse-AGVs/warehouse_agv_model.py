@@ -34,12 +34,19 @@ What to Observe:
 import mesa
 import random
 from typing import List, Tuple, Optional, Dict
-from queue import PriorityQueue
+from functools import lru_cache
+from collections import deque
+import heapq
+import numpy as np
+from numba import njit
 
 # ========================================================================================
 # PHASE 1: A* PATHFINDING ALGORITHM
 # ========================================================================================
 
+# 4-directional movement: (dx, dy) offsets to the neighboring cells
+_NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
 def heuristic(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     """
     Manhattan distance heuristic for A* pathfinding.
@@ -54,71 +61,99 @@ def heuristic(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
 
-def astar(grid: mesa.space.MultiGrid, start: Tuple[int, int], end: Tuple[int, int],
-          obstacles: List[type]) -> List[Tuple[int, int]]:
+def astar(static_blocked: np.ndarray, start: Tuple[int, int],
+          end: Tuple[int, int]) -> List[Tuple[int, int]]:
     """
     A* pathfinding algorithm to navigate around obstacles in the warehouse.
 
     This is crucial for Agent-Environment Interaction: AGVs must intelligently
     navigate around walls and shelves to reach their destinations.
 
+    The search itself runs in the Numba-compiled _astar_kernel().
+
     Args:
-        grid: The Mesa MultiGrid representing the warehouse
+        static_blocked: (width, height) uint8 array, non-zero for non-navigable cells
         start: Starting position (x, y)
         end: Goal position (x, y)
-        obstacles: List of agent types to treat as non-navigable
 
     Returns:
         List of (x, y) coordinates representing the path, or empty list if no path exists
     """
-    # Priority queue for frontier nodes: (f_score, counter, position, path)
-    frontier = PriorityQueue()
-    frontier.put((0, 0, start, [start]))
-    visited = set()
+    path = _astar_kernel(static_blocked, start[0], start[1], end[0], end[1])
+    return list(map(tuple, path.tolist()))
+
+
+@njit("i8[:, ::1](u1[:, ::1], i8, i8, i8, i8)", cache=True)
+def _astar_kernel(blocked, start_x, start_y, end_x, end_y):
+    """
+    Compiled A* search on a blocked-cell array.
+
+    Cells are numbered x * height + y; g_score and came_from are flat arrays
+    indexed by cell number instead of dicts keyed by position tuples.
+
+    Returns:
+        (N, 2) array of path coordinates from start to end, or an empty (0, 2)
+        array if no path exists
+    """
+    width, height = blocked.shape
+    start = start_x * height + start_y
+    end = end_x * height + end_y
+
+    # Priority queue for frontier nodes: (f_score, h_score, counter, cell)
+    # Ties on f go to the node closest to the goal. On an open 4-connected grid many
+    # equal-length routes exist; this expands one of them instead of all of them
+    frontier = [(0, 0, 0, start)]
+    came_from = np.full(width * height, -1, dtype=np.int64)  # Best known predecessor
+    g_score = np.full(width * height, np.iinfo(np.int64).max, dtype=np.int64)
+    g_score[start] = 0
     counter = 0  # Tiebreaker for priority queue
 
-    while not frontier.empty():
-        f_score, _, current, path = frontier.get()
+    while frontier:
+        _, _, _, current = heapq.heappop(frontier)
 
-        # Goal reached!
+        # Goal reached! Walk the predecessors back to start
         if current == end:
+            length = 1
+            cell = current
+            while cell != start:
+                cell = came_from[cell]
+                length += 1
+            path = np.empty((length, 2), dtype=np.int64)
+            cell = current
+            for i in range(length - 1, -1, -1):
+                path[i, 0] = cell // height
+                path[i, 1] = cell % height
+                cell = came_from[cell]
             return path
 
-        if current in visited:
-            continue
-        visited.add(current)
-
         # Explore neighbors (4-directional movement)
-        x, y = current
-        neighbors = [
-            (x + 1, y), (x - 1, y),
-            (x, y + 1), (x, y - 1)
-        ]
-
-        for next_pos in neighbors:
-            # Check if neighbor is within grid bounds
-            if not (0 <= next_pos[0] < grid.width and 0 <= next_pos[1] < grid.height):
-                continue
+        x = current // height
+        y = current % height
 
-            # Check if neighbor is navigable (not an obstacle)
-            cell_contents = grid.get_cell_list_contents([next_pos])
-            is_obstacle = any(isinstance(agent, tuple(obstacles)) for agent in cell_contents)
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            nx, ny = x + dx, y + dy
 
-            if is_obstacle or next_pos in visited:
+            # Check if neighbor is within grid bounds and navigable
+            if not (0 <= nx < width and 0 <= ny < height) or blocked[nx, ny]:
                 continue
-
-            # Calculate scores
-            g_score = len(path)  # Cost from start
-            h_score = heuristic(next_pos, end)  # Estimated cost to goal
-            f_score = g_score + h_score
-
-            # Add to frontier
+            next_cell = nx * height + ny
+
+            # Only push a neighbor when this route improves on the best known one, so
+            # expanded nodes are never re-queued (the Manhattan heuristic is consistent)
+            tentative_g = g_score[current] + 1  # Cost from start
+            if tentative_g >= g_score[next_cell]:
+                continue  # Already reachable at least as cheaply
+            h_score = abs(nx - end_x) + abs(ny - end_y)  # Manhattan distance to goal
+            f_score = tentative_g + h_score
+
+            # Record the better route and add to frontier
+            came_from[next_cell] = current
+            g_score[next_cell] = tentative_g
             counter += 1
-            new_path = path + [next_pos]
-            frontier.put((f_score, counter, next_pos, new_path))
+            heapq.heappush(frontier, (f_score, h_score, counter, next_cell))
 
     # No path found
-    return []
+    return np.empty((0, 2), dtype=np.int64)
 
 
 # ========================================================================================
@@ -212,10 +247,13 @@ class AGVAgent(mesa.Agent):
         # Task and navigation state
         self.state = "IDLE"
         self.task = None  # Will be a dict: {'pickup': (x,y), 'dropoff': (x,y)}
-        self.path = []  # List of positions to follow
+        self.path = ()  # Positions to follow (shared with the model's path cache)
+        self.path_idx = 0  # Index of the next position in self.path
 
         # State tracking for visualization and analysis
         self.steps_waiting = 0  # Track how long blocked (for emergence analysis)
+        self._resume_state = None  # State to return to once no longer WAITING
+        self._charge_target = None  # Charging station being headed for, if any
 
         # Configuration
         self.battery_drain_rate = 0.5  # % per move
@@ -246,14 +284,14 @@ class AGVAgent(mesa.Agent):
         elif self.state == "MOVING_TO_PICKUP":
             self._follow_path()
             # Check if reached pickup location
-            if self.path == [] and self.task is not None:
+            if self.path_idx >= len(self.path) and self.task is not None:
                 self.state = "DELIVERING"
                 self._calculate_path_to(self.task['dropoff'])
 
         elif self.state == "DELIVERING":
             self._follow_path()
             # Check if reached dropoff location
-            if self.path == []:
+            if self.path_idx >= len(self.path):
                 self._complete_task()
 
         elif self.state == "CHARGING":
@@ -282,60 +320,71 @@ class AGVAgent(mesa.Agent):
         - Deadlocks in narrow passages
         - Queue formation at popular destinations
         """
-        if not self.path:
+        if self.path_idx >= len(self.path):
             return
 
-        next_pos = self.path[0]
+        next_pos = self.path[self.path_idx]
 
         # AGENT-AGENT INTERACTION: Collision Avoidance
-        # Check if next position is occupied by another AGV
-        cell_contents = self.model.grid.get_cell_list_contents([next_pos])
-        other_agvs = [agent for agent in cell_contents if isinstance(agent, AGVAgent)]
-
-        if other_agvs:
+        # Check if next position is occupied by another AGV (one array read on the
+        # model's AGV occupancy grid instead of scanning the cell's contents)
+        if self.model.agv_occupancy[next_pos]:
             # EMERGENT BEHAVIOR: Waiting/blocking
-            self.state = "WAITING"
+            if self.state != "WAITING":
+                self._resume_state = self.state
+                self.state = "WAITING"
             self.steps_waiting += 1
             return  # Don't move this step - creates congestion!
 
         # Path is clear - move!
         if self.state == "WAITING":
-            self.state = "MOVING_TO_PICKUP" if self.task and 'pickup' in self.task else "DELIVERING"
+            self.state = self._resume_state
 
-        self.model.grid.move_agent(self, next_pos)
-        self.pos = next_pos
-        self.path.pop(0)  # Remove completed step
+        self._move_to(next_pos)
+        self.path_idx += 1  # Advance past the completed step
 
         # Deplete battery when moving
         self.battery_level = max(0, self.battery_level - self.battery_drain_rate)
         self.steps_waiting = 0  # Reset waiting counter
 
+    def _move_to(self, new_pos: Tuple[int, int]):
+        """
+        Move on the grid, keeping the model's AGV occupancy grid in step.
+        """
+        self.model.agv_occupancy[self.pos] -= 1
+        self.model.agv_occupancy[new_pos] += 1
+        self.model.grid.move_agent(self, new_pos)
+        self.pos = new_pos
+
     def _start_charging(self):
         """
         Interrupt current task and navigate to nearest charging station.
         """
-        charging_stations = [agent for agent in self.model.agents
-                           if isinstance(agent, ChargingStationAgent)]
+        charging_stations = self.model._charging_stations
 
         if not charging_stations:
             return  # No charging stations available!
 
-        # Find nearest charging station
-        nearest_station = min(charging_stations,
-                            key=lambda s: heuristic(self.pos, s.pos))
+        # Find nearest charging station: precomputed walking-distance lookup, with
+        # a straight-line fallback for cells no station can be reached from
+        station_index = self.model.nearest_station_of[self.pos]
+        if station_index >= 0:
+            nearest_station = charging_stations[station_index]
+        else:
+            nearest_station = min(charging_stations,
+                                key=lambda pos: heuristic(self.pos, pos))
 
         self.state = "CHARGING"
-        self._calculate_path_to(nearest_station.pos)
+        self._charge_target = nearest_station
+        self._calculate_path_to(nearest_station)
 
     def _charge_battery(self):
         """
         Charge battery when at a charging station.
         """
-        # Check if actually at a charging station
-        cell_contents = self.model.grid.get_cell_list_contents([self.pos])
-        at_station = any(isinstance(agent, ChargingStationAgent) for agent in cell_contents)
-
-        if at_station:
+        # Check if actually at the charging station (a position compare; the
+        # station was chosen in _start_charging and stations never move)
+        if self.pos == self._charge_target:
             # Charge battery
             self.battery_level = min(100.0, self.battery_level + self.battery_charge_rate)
 
@@ -343,6 +392,7 @@ class AGVAgent(mesa.Agent):
             if self.battery_level >= 100.0:
                 self.state = "IDLE"
                 self.task = None  # Clear any interrupted task
+                self._charge_target = None
         else:
             # Not at station yet, keep moving
             self._follow_path()
@@ -361,8 +411,9 @@ class AGVAgent(mesa.Agent):
         Args:
             destination: Target position (x, y)
         """
-        obstacles = [WallAgent, ShelfAgent]
-        self.path = astar(self.model.grid, self.pos, destination, obstacles)
+        # The cached tuple is never modified - progress is tracked by path_idx
+        self.path = self.model._path_cache(self.pos, destination)
+        self.path_idx = 0
 
         if not self.path:
             # No path found - return to idle
@@ -384,9 +435,8 @@ class AGVAgent(mesa.Agent):
         Args:
             new_pos: New position from real-world sensor data
         """
-        self.model.grid.move_agent(self, new_pos)
-        self.pos = new_pos
-        print(f"[TWIN HOOK] AGV {self.unique_id} position overridden to {new_pos}")
+        self._move_to(new_pos)
+        self.model._twin_log.append((self.unique_id, "pos", new_pos))
 
     def assign_external_task(self, task: Dict):
         """
@@ -403,7 +453,7 @@ class AGVAgent(mesa.Agent):
             self.task = task
             self.state = "MOVING_TO_PICKUP"
             self._calculate_path_to(task['pickup'])
-            print(f"[TWIN HOOK] AGV {self.unique_id} assigned external task: {task}")
+            self.model._twin_log.append((self.unique_id, "task", task))
 
 
 # ========================================================================================
@@ -436,12 +486,20 @@ class WarehouseModel(mesa.Model):
         self.grid = mesa.space.MultiGrid(width, height, torus=False)
 
         # Task management
-        self.available_tasks = []
+        self.available_tasks = deque()  # FIFO task queue
         self.completed_tasks = 0
 
+        # Digital twin hook log: (agv_id, kind, value) records, bounded so a
+        # high-rate sensor feed never grows it without limit (see drain_twin_log)
+        self._twin_log = deque(maxlen=10000)
+
         # Build the warehouse layout
         self._create_warehouse_layout()
 
+        # Path memo: the layout is static and AGVs keep heading for the same few
+        # stations and dropoff points, so (start, destination) pairs repeat
+        self._path_cache = lru_cache(maxsize=4096)(self._astar_uncached)
+
         # Create AGV agents
         self._create_agv_fleet(num_agvs)
 
@@ -493,21 +551,66 @@ class WarehouseModel(mesa.Model):
             "##############################",
         ]
 
-        # Place static agents based on layout
-        for y, row in enumerate(layout):
-            for x, cell in enumerate(row):
-                if cell == '#':
-                    wall = WallAgent(self)
-                    self.grid.place_agent(wall, (x, y))
-                elif cell == 'S':
-                    shelf = ShelfAgent(self)
-                    self.grid.place_agent(shelf, (x, y))
-                elif cell == 'C':
-                    station = ChargingStationAgent(self)
-                    self.grid.place_agent(station, (x, y))
-                elif cell == 'D':
-                    dropoff = DropoffPointAgent(self)
-                    self.grid.place_agent(dropoff, (x, y))
+        # Place static agents based on layout: one (row, column) byte array, scanned
+        # once per symbol, so only the occupied cells are visited in Python
+        cells = np.frombuffer("".join(layout).encode(), dtype="S1").reshape(len(layout), -1)
+        self._layout_cells = cells
+        static_agent_types = (
+            (b'#', WallAgent),
+            (b'S', ShelfAgent),
+            (b'C', ChargingStationAgent),
+            (b'D', DropoffPointAgent),
+        )
+        positions = {}
+        for symbol, agent_class in static_agent_types:
+            positions[agent_class] = [(x, y) for y, x in np.argwhere(cells == symbol).tolist()]
+            for pos in positions[agent_class]:
+                self.grid.place_agent(agent_class(self), pos)
+
+        # Walls and shelves never move: mark them once in an (x, y) grid for A*
+        self.static_blocked = np.ascontiguousarray(((cells == b'#') | (cells == b'S')).T,
+                                                   dtype=np.uint8)
+
+        # Static agents never move, so their positions are looked up once here
+        # rather than by filtering self.agents on every charge or task request
+        self._shelf_positions = positions[ShelfAgent]
+        self._charging_stations = positions[ChargingStationAgent]
+        self._dropoff_positions = positions[DropoffPointAgent]
+
+        self.nearest_station_of = self._map_nearest_stations()
+
+    def _map_nearest_stations(self) -> np.ndarray:
+        """
+        Multi-source BFS from every charging station over the static layout.
+
+        Returns:
+            (width, height) int32 array holding, for each cell, the index into
+            _charging_stations of the station with the shortest walking route
+            (-1 where no station is reachable)
+        """
+        nearest = np.full(self.static_blocked.shape, -1, dtype=np.int32)
+        width, height = nearest.shape
+        frontier = deque()
+        for index, pos in enumerate(self._charging_stations):
+            nearest[pos] = index
+            frontier.append(pos)
+
+        while frontier:
+            x, y = frontier.popleft()
+            for dx, dy in _NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if (0 <= nx < width and 0 <= ny < height
+                        and not self.static_blocked[nx, ny] and nearest[nx, ny] < 0):
+                    nearest[nx, ny] = nearest[x, y]
+                    frontier.append((nx, ny))
+        return nearest
+
+    def _astar_uncached(self, start: Tuple[int, int],
+                        destination: Tuple[int, int]) -> Tuple[Tuple[int, int], ...]:
+        """
+        A* path over the static layout, as an immutable tuple for _path_cache.
+        """
+        return tuple(astar(self.static_blocked, start, destination))
 
     def _create_agv_fleet(self, num_agvs: int):
         """
@@ -516,25 +619,21 @@ class WarehouseModel(mesa.Model):
         Args:
             num_agvs: Number of AGVs to create
         """
-        # Find all open spaces for AGV starting positions
-        open_spaces = []
-        for x in range(self.grid.width):
-            for y in range(self.grid.height):
-                cell_contents = self.grid.get_cell_list_contents([(x, y)])
-                # Cell is open if it has no agents or only has dropoff/charging
-                is_open = not any(isinstance(agent, (WallAgent, ShelfAgent, AGVAgent))
-                                for agent in cell_contents)
-                if is_open:
-                    open_spaces.append((x, y))
-
-        # Create AGVs at random open positions
-        for i in range(num_agvs):
-            if open_spaces:
-                pos = random.choice(open_spaces)
-                open_spaces.remove(pos)  # Don't place multiple AGVs at same spot initially
-
-                agv = AGVAgent(self, pos)
-                self.grid.place_agent(agv, pos)
+        # Find all open spaces for AGV starting positions from the layout symbols
+        # (open space, dropoff and charging cells; not walls or shelves)
+        cells = self._layout_cells
+        row_length = cells.shape[1]
+        open_cells = np.flatnonzero((cells != b'#') & (cells != b'S')).tolist()
+        open_spaces = [(i % row_length, i // row_length) for i in open_cells]
+
+        # AGVs per cell, maintained by AGVAgent._move_to() for collision checks
+        self.agv_occupancy = np.zeros((self.grid.width, self.grid.height), dtype=np.uint8)
+
+        # Create AGVs at distinct random open positions
+        for pos in random.sample(open_spaces, min(num_agvs, len(open_spaces))):
+            agv = AGVAgent(self, pos)
+            self.grid.place_agent(agv, pos)
+            self.agv_occupancy[pos] += 1
 
     def _generate_tasks(self, num_tasks: int):
         """
@@ -543,24 +642,20 @@ class WarehouseModel(mesa.Model):
         Args:
             num_tasks: Number of tasks to generate
         """
-        # Find all shelf positions (pickup points)
-        shelf_positions = [agent.pos for agent in self.agents
-                          if isinstance(agent, ShelfAgent)]
-
-        # Find all dropoff positions
-        dropoff_positions = [agent.pos for agent in self.agents
-                            if isinstance(agent, DropoffPointAgent)]
+        # Shelf positions (pickup points) and dropoff positions
+        shelf_positions = self._shelf_positions
+        dropoff_positions = self._dropoff_positions
 
         if not shelf_positions or not dropoff_positions:
             return
 
-        # Generate tasks
-        for _ in range(num_tasks):
-            task = {
-                'pickup': random.choice(shelf_positions),
-                'dropoff': random.choice(dropoff_positions)
-            }
-            self.available_tasks.append(task)
+        # Generate tasks: draw all pickups and dropoffs in one call each
+        pickups = random.choices(shelf_positions, k=num_tasks)
+        dropoffs = random.choices(dropoff_positions, k=num_tasks)
+        self.available_tasks.extend(
+            {'pickup': pickup, 'dropoff': dropoff}
+            for pickup, dropoff in zip(pickups, dropoffs)
+        )
 
     def assign_task_to_agv(self, agv: AGVAgent) -> Optional[Dict]:
         """
@@ -573,7 +668,7 @@ class WarehouseModel(mesa.Model):
             Task dictionary or None if no tasks available
         """
         if self.available_tasks:
-            task = self.available_tasks.pop(0)
+            task = self.available_tasks.popleft()
 
             # Generate new tasks to keep the queue full
             if len(self.available_tasks) < 10:
@@ -582,6 +677,16 @@ class WarehouseModel(mesa.Model):
             return task
         return None
 
+    def drain_twin_log(self) -> List[Tuple[int, str, object]]:
+        """
+        Remove and return the recorded digital twin hook calls, oldest first.
+
+        Each record is (agv_id, "pos", new_pos) or (agv_id, "task", task).
+        """
+        records = list(self._twin_log)
+        self._twin_log.clear()
+        return records
+
     def step(self):
         """
         Execute one step of the model (all agents act once).
@@ -589,8 +694,12 @@ class WarehouseModel(mesa.Model):
         In Mesa 3.x, we use shuffle_do() to execute agent methods in random order.
         This prevents artifacts from fixed execution order, equivalent to RandomActivation.
         """
-        # Only call step on AGV agents (static agents don't have step methods)
-        self.agents.select(lambda a: isinstance(a, AGVAgent)).shuffle_do("step")
+        # Only call step on AGV agents (static agents don't have step methods).
+        # agents_by_type is kept up to date by Mesa, so the ~600 static agents
+        # are not re-filtered every tick. There is no entry for an empty fleet.
+        agvs = self.agents_by_type.get(AGVAgent)
+        if agvs:
+            agvs.shuffle_do("step")
 
 
 # ========================================================================================
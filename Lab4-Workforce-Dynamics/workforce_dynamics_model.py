@@ -16,7 +16,7 @@ System Dynamics Concepts Demonstrated:
 Implementation Approach:
     - Built from scratch using Euler integration (no specialized SD libraries)
     - Simple for-loop time-stepping makes the mechanics transparent
-    - Pure Python + matplotlib for visualization
+    - Equations and the time-step loop compiled with Numba; matplotlib for visualization
 
 Scenario:
     1. Company starts in equilibrium (100 employees, 500 project backlog)
@@ -31,6 +31,7 @@ Expected Outcome:
 
 import matplotlib.pyplot as plt
 import numpy as np
+from numba import njit, prange, vectorize
 
 # ========================================================================================
 # PHASE 1: MODEL SETUP AND EQUATIONS
@@ -72,6 +73,7 @@ SHOCK_SIZE = 1200          # Additional projects from big contract (4 months of
 # PHASE 1: SYSTEM EQUATIONS (Non-linear Relationships & Feedback)
 # ========================================================================================
 
+@njit(cache=True)
 def calculate_schedule_pressure(backlog, workforce):
     """
     Calculate workload pressure: projects per employee.
@@ -93,6 +95,7 @@ def calculate_schedule_pressure(backlog, workforce):
     return backlog / workforce
 
 
+@vectorize(["f8(f8)"], cache=True)
 def calculate_effect_of_pressure_on_productivity(pressure):
     """
     Non-linear relationship: How schedule pressure affects productivity.
@@ -107,8 +110,11 @@ def calculate_effect_of_pressure_on_productivity(pressure):
         - Pressure = 10: Effect = 0.6 (significant degradation)
         - Pressure = 15+: Effect = 0.4 (crisis mode, very inefficient)
 
+    Compiled as a NumPy ufunc, so it also accepts an array of pressures
+    (e.g. one per Monte Carlo trial) and evaluates them all in one call.
+
     Args:
-        pressure: Schedule pressure (projects per person)
+        pressure: Schedule pressure (projects per person), scalar or array
 
     Returns:
         Multiplier on nominal productivity (1.0 = baseline)
@@ -131,6 +137,7 @@ def calculate_effect_of_pressure_on_productivity(pressure):
         return max(0.3, 0.6 - (pressure - 10.0) * 0.04)
 
 
+@vectorize(["f8(f8)"], cache=True)
 def calculate_effect_of_pressure_on_quitting(pressure):
     """
     Non-linear relationship: How schedule pressure affects turnover.
@@ -144,8 +151,10 @@ def calculate_effect_of_pressure_on_quitting(pressure):
         - Pressure = 10: Effect = 3.0 (triple the quit rate!)
         - Pressure = 15: Effect = 6.0 (exodus!)
 
+    Compiled as a NumPy ufunc, like the productivity effect above.
+
     Args:
-        pressure: Schedule pressure (projects per person)
+        pressure: Schedule pressure (projects per person), scalar or array
 
     Returns:
         Multiplier on normal quit rate (1.0 = baseline)
@@ -159,6 +168,7 @@ def calculate_effect_of_pressure_on_quitting(pressure):
         return 1.0 * (2.0 ** (excess_pressure / 2.0))
 
 
+@njit(cache=True)
 def calculate_completion_rate(workforce, productivity_effect):
     """
     Flow: How many projects are completed per month.
@@ -177,6 +187,7 @@ def calculate_completion_rate(workforce, productivity_effect):
     return workforce * NOMINAL_PRODUCTIVITY * productivity_effect
 
 
+@njit(cache=True)
 def calculate_quit_rate(workforce, quitting_effect):
     """
     Flow: How many employees leave per month.
@@ -196,7 +207,8 @@ def calculate_quit_rate(workforce, quitting_effect):
     return workforce * monthly_normal_quit_fraction * quitting_effect
 
 
-def calculate_hiring_rate(workforce, backlog):
+@njit(cache=True)
+def calculate_hiring_rate(workforce, backlog, time_to_adjust_hiring=TIME_TO_ADJUST_HIRING):
     """
     Flow: How many employees are hired per month.
 
@@ -209,6 +221,7 @@ def calculate_hiring_rate(workforce, backlog):
     Args:
         workforce: Current number of employees
         backlog: Current project backlog
+        time_to_adjust_hiring: Hiring delay in months (defaults to TIME_TO_ADJUST_HIRING)
 
     Returns:
         New hires per month
@@ -221,7 +234,7 @@ def calculate_hiring_rate(workforce, backlog):
 
     # Close the gap gradually over TIME_TO_ADJUST_HIRING months
     # If gap is positive, hire. If negative, stop hiring (but don't fire).
-    hiring = max(0, workforce_gap / TIME_TO_ADJUST_HIRING)
+    hiring = max(0, workforce_gap / time_to_adjust_hiring)
 
     return hiring
 
@@ -230,119 +243,188 @@ def calculate_hiring_rate(workforce, backlog):
 # PHASE 2: SIMULATION ENGINE - EULER INTEGRATION
 # ========================================================================================
 
-def run_simulation():
+@njit(cache=True)
+def _simulate_into(history, dt, initial_workforce, initial_backlog, time_shock,
+                   shock_size, new_projects_rate, time_to_adjust_hiring):
     """
-    Execute the System Dynamics simulation using Euler integration.
+    Compiled Euler loop behind run_simulation() and run_simulation_batch().
 
-    This is the core of SD: stepping through time, updating stocks based on flows.
+    Numba freezes module-level globals at compile time, so the scenario
+    parameters are passed in as arguments. Changing e.g. SHOCK_SIZE before
+    calling run_simulation() therefore takes effect without recompiling.
 
     The order of operations in each time step is CRITICAL:
         1. Record current state (for plotting later)
-        2. Calculate auxiliary variables (based on current stocks)
-        3. Calculate all flows (based on auxiliary variables)
-        4. Update stocks (based on flows)
-        5. Advance time
+        2. Apply the contract shock (if this is the shock month)
+        3. Calculate auxiliary variables (based on current stocks)
+        4. Calculate all flows (based on auxiliary variables)
+        5. Update stocks (based on flows)
+
+    Args:
+        history: Preallocated (n_months + 1, 7) array, filled in place with
+            columns: workforce, backlog, pressure, productivity effect,
+            quit rate, hiring rate, completion rate
 
     Returns:
-        Dictionary containing time series of all key variables
+        (final_workforce, final_backlog) after the last month's update
     """
     # Initialize stocks (state variables)
-    workforce = INITIAL_WORKFORCE
-    project_backlog = INITIAL_BACKLOG
-
-    # Initialize history tracking (for visualization)
-    time_history = []
-    workforce_history = []
-    backlog_history = []
-    pressure_history = []
-    productivity_effect_history = []
-    quit_rate_history = []
-    hiring_rate_history = []
-    completion_rate_history = []
-
-    # Main simulation loop - step through time
-    for t in range(SIMULATION_MONTHS + 1):
-        # ================================================================================
+    workforce = float(initial_workforce)
+    project_backlog = float(initial_backlog)
+
+    # Main simulation loop - step through time (one history row per month)
+    for t in range(history.shape[0]):
         # STEP 1: RECORD CURRENT STATE
-        # ================================================================================
-        time_history.append(t)
-        workforce_history.append(workforce)
-        backlog_history.append(project_backlog)
+        history[t, 0] = workforce
+        history[t, 1] = project_backlog
 
-        # ================================================================================
         # STEP 2: POLICY SHOCK - BIG CONTRACT ARRIVES
-        # ================================================================================
-        # At month 6, a large new contract arrives, suddenly increasing the backlog
-        if t == TIME_SHOCK:
-            project_backlog += SHOCK_SIZE
-            print(f"\n{'='*70}")
-            print(f"MONTH {t}: BIG CONTRACT SHOCK!")
-            print(f"  +{SHOCK_SIZE} projects added to backlog")
-            print(f"  New backlog: {project_backlog:.0f} projects")
-            print(f"{'='*70}\n")
-
-        # ================================================================================
+        if t == time_shock:
+            project_backlog += shock_size
+
         # STEP 3: CALCULATE AUXILIARY VARIABLES (based on current stock values)
-        # ================================================================================
         schedule_pressure = calculate_schedule_pressure(project_backlog, workforce)
         productivity_effect = calculate_effect_of_pressure_on_productivity(schedule_pressure)
         quitting_effect = calculate_effect_of_pressure_on_quitting(schedule_pressure)
 
-        # Record auxiliary variables
-        pressure_history.append(schedule_pressure)
-        productivity_effect_history.append(productivity_effect)
-
-        # ================================================================================
         # STEP 4: CALCULATE FLOWS (rates of change)
-        # ================================================================================
         completion_rate = calculate_completion_rate(workforce, productivity_effect)
         quit_rate = calculate_quit_rate(workforce, quitting_effect)
-        hiring_rate = calculate_hiring_rate(workforce, project_backlog)
+        hiring_rate = calculate_hiring_rate(workforce, project_backlog, time_to_adjust_hiring)
 
-        # Record flow rates
-        quit_rate_history.append(quit_rate)
-        hiring_rate_history.append(hiring_rate)
-        completion_rate_history.append(completion_rate)
+        history[t, 2] = schedule_pressure
+        history[t, 3] = productivity_effect
+        history[t, 4] = quit_rate
+        history[t, 5] = hiring_rate
+        history[t, 6] = completion_rate
 
-        # ================================================================================
         # STEP 5: UPDATE STOCKS using Euler integration
-        # ================================================================================
         # Stock equation: New_Value = Old_Value + (Inflows - Outflows) * DT
 
         # Workforce stock update
         # Inflow: hiring_rate, Outflow: quit_rate
-        workforce += (hiring_rate - quit_rate) * DT
-        workforce = max(1, workforce)  # Can't go below 1 employee (company still exists)
+        workforce += (hiring_rate - quit_rate) * dt
+        workforce = max(1.0, workforce)  # Can't go below 1 employee (company still exists)
 
         # Project backlog stock update
         # Inflow: new_projects_rate, Outflow: completion_rate
-        project_backlog += (NEW_PROJECTS_RATE - completion_rate) * DT
-        project_backlog = max(0, project_backlog)  # Can't have negative backlog
-
-        # ================================================================================
-        # STEP 6: DIAGNOSTIC OUTPUT (every 6 months)
-        # ================================================================================
-        if t % 6 == 0:
-            print(f"Month {t:2d}: Workforce={workforce:6.1f}, "
-                  f"Backlog={project_backlog:6.1f}, "
-                  f"Pressure={schedule_pressure:4.2f}, "
-                  f"Productivity={productivity_effect:4.2f}, "
-                  f"Hiring={hiring_rate:5.2f}, "
-                  f"Quitting={quit_rate:4.2f}")
+        project_backlog += (new_projects_rate - completion_rate) * dt
+        project_backlog = max(0.0, project_backlog)  # Can't have negative backlog
+
+    return workforce, project_backlog
+
+
+@njit(parallel=True, cache=True)
+def _simulate_batch(param_matrix, n_months, dt, initial_workforce, initial_backlog,
+                    time_shock):
+    """
+    Run one independent Euler loop per parameter row, spread across CPU cores.
+
+    Each scenario writes only to its own slice of the output array, so the
+    prange iterations share no state.
+    """
+    n_scenarios = param_matrix.shape[0]
+    histories = np.empty((n_scenarios, n_months + 1, 7))
+    for i in prange(n_scenarios):
+        _simulate_into(histories[i], dt, initial_workforce, initial_backlog, time_shock,
+                       param_matrix[i, 1], param_matrix[i, 2], param_matrix[i, 0])
+    return histories
+
+
+def run_simulation(verbose=True, log_every=6):
+    """
+    Execute the System Dynamics simulation using Euler integration.
+
+    This is the core of SD: stepping through time, updating stocks based on flows.
+    The time-step loop itself runs in the Numba-compiled _simulate_into(); this
+    function prints the shock and the diagnostic lines from the recorded history.
+
+    Args:
+        verbose: Print the shock banner and periodic diagnostics (pass False
+            when calling repeatedly, e.g. from a dashboard or sweep)
+        log_every: Months between diagnostic lines
+
+    Returns:
+        Dictionary containing time series of all key variables as NumPy arrays.
+        Each series is a contiguous row of one (7, months + 1) array, also
+        returned under 'history' (e.g. for a single np.save of the whole run).
+    """
+    # One row per series, so each time series is contiguous in memory;
+    # the compiled loop fills it month by month through the transposed view
+    history = np.empty((7, SIMULATION_MONTHS + 1))
+    final_workforce, final_backlog = _simulate_into(
+        history.T, DT, INITIAL_WORKFORCE, INITIAL_BACKLOG, TIME_SHOCK,
+        SHOCK_SIZE, NEW_PROJECTS_RATE, TIME_TO_ADJUST_HIRING)
+    (workforce_history, backlog_history, pressure_history, productivity_effect_history,
+     quit_rate_history, hiring_rate_history, completion_rate_history) = history
+
+    if verbose:
+        # Stocks after each month's update: the next month's recorded state
+        workforce_after = np.append(workforce_history[1:], final_workforce)
+        backlog_after = np.append(backlog_history[1:], final_backlog)
+
+        for t in range(SIMULATION_MONTHS + 1):
+            # At month 6, a large new contract arrives, suddenly increasing the backlog
+            if t == TIME_SHOCK:
+                print(f"\n{'='*70}")
+                print(f"MONTH {t}: BIG CONTRACT SHOCK!")
+                print(f"  +{SHOCK_SIZE} projects added to backlog")
+                print(f"  New backlog: {backlog_history[t] + SHOCK_SIZE:.0f} projects")
+                print(f"{'='*70}\n")
+
+            # DIAGNOSTIC OUTPUT (every log_every months)
+            if t % log_every == 0:
+                print(f"Month {t:2d}: Workforce={workforce_after[t]:6.1f}, "
+                      f"Backlog={backlog_after[t]:6.1f}, "
+                      f"Pressure={pressure_history[t]:4.2f}, "
+                      f"Productivity={productivity_effect_history[t]:4.2f}, "
+                      f"Hiring={hiring_rate_history[t]:5.2f}, "
+                      f"Quitting={quit_rate_history[t]:4.2f}")
 
     # Return all histories for plotting
     return {
-        'time': time_history,
+        'time': np.arange(SIMULATION_MONTHS + 1),
         'workforce': workforce_history,
         'backlog': backlog_history,
         'pressure': pressure_history,
         'productivity_effect': productivity_effect_history,
         'quit_rate': quit_rate_history,
         'hiring_rate': hiring_rate_history,
-        'completion_rate': completion_rate_history
+        'completion_rate': completion_rate_history,
+        'history': history
     }
 
 
+def run_simulation_batch(param_matrix):
+    """
+    Run many what-if scenarios at once (parameter sweep / Monte Carlo).
+
+    Each row of param_matrix is one scenario; the scenarios run in parallel
+    across CPU cores. All other settings (duration, time step, initial stocks,
+    shock month) come from the module configuration. Nothing is printed.
+
+    Args:
+        param_matrix: Array of shape (N, 3) with columns
+            TIME_TO_ADJUST_HIRING, SHOCK_SIZE, NEW_PROJECTS_RATE
+
+    Returns:
+        Array of shape (N, SIMULATION_MONTHS + 1, 7) with the same columns
+        as _simulate_into(): workforce, backlog, pressure, productivity
+        effect, quit rate, hiring rate, completion rate
+
+    Example:
+        params = np.array([[3.0, 1200, 300.0],
+                           [6.0, 1200, 300.0],
+                           [3.0,  200, 300.0]])
+        peak_pressure = run_simulation_batch(params)[:, :, 2].max(axis=1)
+    """
+    param_matrix = np.ascontiguousarray(param_matrix, dtype=np.float64)
+    if param_matrix.ndim != 2 or param_matrix.shape[1] != 3:
+        raise ValueError("param_matrix must have shape (N, 3)")
+    return _simulate_batch(param_matrix, SIMULATION_MONTHS, DT, INITIAL_WORKFORCE,
+                           INITIAL_BACKLOG, TIME_SHOCK)
+
+
 # ========================================================================================
 # PHASE 3: VISUALIZATION AND ANALYSIS
 # ========================================================================================
@@ -456,12 +538,12 @@ def print_analysis(results):
     pressure = results['pressure']
 
     # Find peak workforce
-    max_workforce_idx = workforce.index(max(workforce))
+    max_workforce_idx = int(np.argmax(workforce))  # First peak, in one pass
     max_workforce = workforce[max_workforce_idx]
     max_workforce_time = time[max_workforce_idx]
 
     # Find peak pressure
-    max_pressure_idx = pressure.index(max(pressure))
+    max_pressure_idx = int(np.argmax(pressure))
     max_pressure = pressure[max_pressure_idx]
     max_pressure_time = time[max_pressure_idx]
 
@@ -634,26 +716,33 @@ EXAMPLE API INTEGRATION CODE:
 ------------------------------
 
 ```python
-import requests
-from workforce_dynamics_model import run_simulation
+import asyncio
+import aiohttp
+import workforce_dynamics_model as model
+
+async def fetch_json(session, url):
+    async with session.get(url) as response:
+        return await response.json()
 
 # Fetch current state from company systems
-def get_current_state():
-    # Get workforce from HRIS
-    workforce_data = requests.get('https://hris.company.com/api/headcount').json()
-    current_workforce = workforce_data['total_employees']
+async def get_current_state():
+    # Query HRIS (workforce) and PMO (backlog) concurrently, so a refresh
+    # waits for the slower system rather than for both in turn
+    async with aiohttp.ClientSession() as session:
+        workforce_data, pmo_data = await asyncio.gather(
+            fetch_json(session, 'https://hris.company.com/api/headcount'),
+            fetch_json(session, 'https://pmo.company.com/api/active_projects'))
 
-    # Get backlog from PMO
-    pmo_data = requests.get('https://pmo.company.com/api/active_projects').json()
+    current_workforce = workforce_data['total_employees']
     current_backlog = pmo_data['active_count']
 
     return current_workforce, current_backlog
 
 # Initialize model with real data
-INITIAL_WORKFORCE, INITIAL_BACKLOG = get_current_state()
+model.INITIAL_WORKFORCE, model.INITIAL_BACKLOG = asyncio.run(get_current_state())
 
 # Run prediction
-results = run_simulation()
+results = model.run_simulation(verbose=False)
 
 # Alert if pressure will exceed threshold
 if max(results['pressure']) > 8.0:
@@ -8,7 +8,7 @@ This script demonstrates the "Publisher" side of the Publish/Subscribe pattern,
 which is fundamental to IoT and Digital Twin architectures.
 
 Prerequisites:
-    - paho-mqtt library: pip install paho-mqtt
+    - paho-mqtt and numpy: pip install paho-mqtt numpy
     - Running MQTT broker (e.g., Mosquitto)
       Install: apt-get install mosquitto mosquitto-clients
       Start: mosquitto -v
@@ -30,9 +30,10 @@ Usage:
 import paho.mqtt.client as mqtt
 import time
 import json
-import random
 from datetime import datetime
 
+import numpy as np
+
 # ========================================================================================
 # CONFIGURATION
 # ========================================================================================
@@ -56,6 +57,14 @@ UNIT = "Celsius"              # Temperature unit
 BASE_TEMPERATURE = 22.0        # Base temperature (°C)
 TEMPERATURE_VARIANCE = 3.0     # Random variation (±°C)
 DRIFT_RATE = 0.1              # Slow drift to simulate environment changes
+NOISE_BATCH_SIZE = 1024       # Noise/drift samples drawn per NumPy call
+
+# Static sensor description sent with every reading
+SENSOR_METADATA = {
+    "location": "Lab Environment",
+    "sensor_type": "Simulated Thermistor",
+    "firmware_version": "1.0.0"
+}
 
 
 # ========================================================================================
@@ -107,8 +116,30 @@ client.on_publish = on_publish
 # DATA GENERATION
 # ========================================================================================
 
+_rng = np.random.default_rng()
+_noise_drift_buf = iter(())
+
 # Initialize temperature with some random offset
-current_temperature = BASE_TEMPERATURE + random.uniform(-2, 2)
+current_temperature = BASE_TEMPERATURE + float(_rng.uniform(-2, 2))
+
+
+def _next_noise_and_drift():
+    """
+    Return the next (noise, drift) sample pair.
+
+    Refills a batch of NOISE_BATCH_SIZE pairs from NumPy when the previous
+    batch is used up.
+    """
+    global _noise_drift_buf
+
+    sample = next(_noise_drift_buf, None)
+    if sample is None:
+        noise = _rng.normal(0, 0.3, NOISE_BATCH_SIZE)  # Gaussian noise, σ = 0.3°C
+        drift = _rng.uniform(-DRIFT_RATE, DRIFT_RATE, NOISE_BATCH_SIZE)
+        _noise_drift_buf = zip(noise.tolist(), drift.tolist())
+        sample = next(_noise_drift_buf)
+    return sample
+
 
 def generate_temperature_reading():
     """
@@ -124,11 +155,9 @@ def generate_temperature_reading():
     """
     global current_temperature
 
-    # Add random noise (simulates sensor precision limits)
-    noise = random.gauss(0, 0.3)  # Gaussian noise, σ = 0.3°C
-
-    # Add slow drift (simulates environmental changes)
-    drift = random.uniform(-DRIFT_RATE, DRIFT_RATE)
+    # Random noise (simulates sensor precision limits) and
+    # slow drift (simulates environmental changes)
+    noise, drift = _next_noise_and_drift()
 
     # Update current temperature
     current_temperature += drift
@@ -143,6 +172,43 @@ def generate_temperature_reading():
     return round(measured_temperature, 1)
 
 
+# Only the timestamp and the value change between readings, so the rest of the
+# JSON document is serialized once here and the two fields are filled in per
+# message. The result is identical to json.dumps() of the full payload dict:
+# {"timestamp_utc": ..., "sensor_id": ..., "value": ..., "unit": ..., "metadata": {...}}
+# indent=None (the default) keeps it compact for transmission (saves bandwidth)
+_PAYLOAD_TEMPLATE = (
+    '{"timestamp_utc": "%s", '
+    '"sensor_id": ' + json.dumps(SENSOR_ID).replace('%', '%%') + ', '
+    '"value": %r, '
+    '"unit": ' + json.dumps(UNIT).replace('%', '%%') + ', '
+    '"metadata": ' + json.dumps(SENSOR_METADATA).replace('%', '%%') + '}'
+)
+
+
+_timestamp_second = None
+_timestamp_prefix = ""
+
+
+def utc_timestamp():
+    """
+    Current UTC time in ISO 8601 format with microseconds.
+
+    The date and time-of-day part only changes once per second, so it is
+    formatted once and reused for every reading within that second.
+
+    Returns:
+        str: e.g. "2024-01-15T14:23:45.123456Z"
+    """
+    global _timestamp_second, _timestamp_prefix
+
+    seconds, microseconds = divmod(time.time_ns() // 1000, 1_000_000)
+    if seconds != _timestamp_second:
+        _timestamp_second = seconds
+        _timestamp_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    return f"{_timestamp_prefix}.{microseconds:06d}Z"
+
+
 def create_sensor_payload(temperature_value):
     """
     Create a JSON payload for the sensor reading.
@@ -159,23 +225,7 @@ def create_sensor_payload(temperature_value):
     Returns:
         str: JSON-formatted payload
     """
-    # Create structured data dictionary
-    payload = {
-        "timestamp_utc": datetime.utcnow().isoformat() + 'Z',  # ISO 8601 format
-        "sensor_id": SENSOR_ID,
-        "value": temperature_value,
-        "unit": UNIT,
-        "metadata": {
-            "location": "Lab Environment",
-            "sensor_type": "Simulated Thermistor",
-            "firmware_version": "1.0.0"
-        }
-    }
-
-    # Serialize to JSON string
-    # indent=None for compact transmission (saves bandwidth)
-    # For debugging, use indent=2 for pretty-printing
-    return json.dumps(payload)
+    return _PAYLOAD_TEMPLATE % (utc_timestamp(), float(temperature_value))
 
 
 # ========================================================================================
@@ -211,6 +261,10 @@ def main():
 
         print("\nPublishing sensor readings... (Press Ctrl+C to stop)\n")
 
+        # Wake-ups are anchored to a monotonic schedule, so the time spent
+        # generating, publishing and printing does not add up as drift
+        next_wake = time.monotonic()
+
         while True:
             # Generate temperature reading
             temperature = generate_temperature_reading()
@@ -242,8 +296,11 @@ def main():
 
             print()  # Blank line for readability
 
-            # Wait before next reading
-            time.sleep(PUBLISH_INTERVAL)
+            # Wait until the next scheduled reading
+            next_wake += PUBLISH_INTERVAL
+            sleep_for = next_wake - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
 
     except KeyboardInterrupt:
         # Clean shutdown on Ctrl+C